@@ -1,7 +1,9 @@
 # Import libraries and packages
 import matplotlib.pyplot as plt
 from mpl_toolkits import mplot3d
-import numpy as np
+from dibujo import BoxRenderer
+from instrumentacion import FrameTimer
+from rotaciones import IncrementalRotation, RotX
 
 # create the fig and ax objects to handle figure and axes of the fixed frame
 fig,ax = plt.subplots()
@@ -42,127 +44,54 @@ def fix_system(axis_length, linewidth=5):
     ax.plot3D(zp, zp, z, color='green',linewidth=linewidth)
     
 
-def sind(t):
-    # sind function
-    # Computes the sin() trigonometric function in degrees
-    # ----------------------------------------------------------------------
-    # Arguments
-    # t -> Numeric, angle in degrees. 
-    # ----------------------------------------------------------------------
-    res = np.sin(t*np.pi/180)
-    return res
-
-def cosd(t):
-    # sind function
-    # Computes the cos() trigonometric function in degrees
-    # ----------------------------------------------------------------------
-    # Arguments
-    # t -> Numeric, angle in degrees. 
-    # ----------------------------------------------------------------------
-    res = np.cos(t*np.pi/180)
-    return res
-
-
-def RotX(t):
-    Rx = np.array(([1,0,0],[0,cosd(t),-sind(t)],[0,sind(t),cosd(t)]))
-    return Rx
-
-def drawVector(p_fin, p_init=[0,0,0], color='black',linewidth=1):
-    deltaX = [p_init[0], p_fin[0]]
-    deltaY = [p_init[1], p_fin[1]]
-    deltaZ = [p_init[2], p_fin[2]]
-    ax.plot3D(deltaX, deltaY, deltaZ,color=color, linewidth=linewidth)
-
-
-
-def drawBox(p1, p2, p3, p4, p5, p6, p7, p8, color = 'black'):
-
-    drawScatter(p1)
-    drawScatter(p2)
-    drawScatter(p3)
-    drawScatter(p4)
-    drawScatter(p5)
-    drawScatter(p6)
-    drawScatter(p7)
-    drawScatter(p8)
-
-    drawVector(p1,p2,color = color)
-    drawVector(p2,p3,color = color)
-    drawVector(p3,p4,color = color)
-    drawVector(p4,p1,color = color)
-    drawVector(p5,p6,color = color)
-    drawVector(p6,p7,color = color)
-    drawVector(p7,p8,color = color)
-    drawVector(p8,p5,color = color)
-    drawVector(p4,p8,color = color)
-    drawVector(p1,p5,color = color)
-    drawVector(p3,p7,color = color)
-    drawVector(p2,p6,color = color)
-
-
-def drawScatter(point,color='black',marker='o'):
-    ax.scatter(point[0],point[1],point[2],marker='o')
-
-def rotate_box(p1,p2,p3,p4,p5,p6,p7,p8,axis='y', angle = 0):
-    rotation_matrix = 0
-    if axis=='x':
-       rotation_matrix = RotX(angle)
-    if axis=='y':
-       pass
-    if axis=='z':
-        pass
-
-    p1_rot = rotation_matrix.dot(p1)
-    p2_rot = rotation_matrix.dot(p2)
-    p3_rot = rotation_matrix.dot(p3)
-    p4_rot = rotation_matrix.dot(p4)
-    p5_rot = rotation_matrix.dot(p5)
-    p6_rot = rotation_matrix.dot(p6)
-    p7_rot = rotation_matrix.dot(p7)
-    p8_rot = rotation_matrix.dot(p8)
-
-    return [p1_rot,p2_rot, p3_rot, p4_rot, p5_rot, p6_rot, p7_rot, p8_rot]
-
-
 def rotate(t):
+    # Set the view 
+    setaxis(-15,15,-15,15,-15,15)
+
+    # plot the axis
+    fix_system(10,1)
+
+    # puntos iniciales del cubo
+    p1_init = [0,0,0]
+    p2_init = [7,0,0]
+    p3_init = [7,0,3]
+    p4_init = [0,0,3]
+    p5_init = [0,2,0]
+    p6_init = [7,2,0]
+    p7_init = [7,2,3]
+    p8_init = [0,2,3]
+
+    # dibuja cubo inicial y crea los artistas del cubo rotado una sola vez
+    points_init = [p1_init, p2_init, p3_init, p4_init,
+                   p5_init, p6_init, p7_init, p8_init]
+    BoxRenderer(ax, points_init)
+    box_rot = BoxRenderer(ax, points_init, color='red')
+
+    # tiempos por cuadro (solo con ROBOTICA_TIMING=1)
+    timer = FrameTimer.from_env(interval=0.05, name="rotate x")
+
+    # giro de 1° por cuadro: una rotación delta aplicada a los vértices en
+    # su lugar, en vez de reconstruir RotX(n) desde el ángulo absoluto
+    rotation = IncrementalRotation(points_init, RotX(1))
+
     n = 0
     while n < t: 
-        ax.cla()
-
-        # Set the view 
-        setaxis(-15,15,-15,15,-15,15)
-
-        # plot the axis
-        fix_system(10,1)
-
-        # puntos iniciales del cubo
-        p1_init = [0,0,0]
-        p2_init = [7,0,0]
-        p3_init = [7,0,3]
-        p4_init = [0,0,3]
-        p5_init = [0,2,0]
-        p6_init = [7,2,0]
-        p7_init = [7,2,3]
-        p8_init = [0,2,3]
-
-        # dibuja cubo inicial
-        drawBox(p1_init, p2_init, p3_init, p4_init,
-                p5_init, p6_init, p7_init, p8_init)
-
-        # rota cubo
-        [p1_rot, p2_rot, p3_rot, p4_rot, 
-         p5_rot, p6_rot, p7_rot, p8_rot] = rotate_box(
-             p1_init, p2_init, p3_init, p4_init,
-             p5_init, p6_init, p7_init, p8_init,
-             axis='x', angle=n)
-
-        # dibuja cubo rotado
-        drawBox(p1_rot, p2_rot, p3_rot, p4_rot,
-                p5_rot, p6_rot, p7_rot, p8_rot, color='red')
-
-        n = n + 1
-        plt.draw()
-        plt.pause(0.05)
+        with timer.frame():
+            # actualiza cubo rotado
+            with timer.phase("artists"):
+                box_rot.update(rotation.points)
+
+            # rota cubo para el siguiente cuadro
+            with timer.phase("kinematics"):
+                rotation.step()
+
+            n = n + 1
+            with timer.phase("draw"):
+                plt.draw()
+            with timer.phase("pause"):
+                plt.pause(0.05)
+
+    timer.finish()
 
 
 # Llamar la animación
@@ -0,0 +1,77 @@
+# Import libraries and packages
+import sys
+import matplotlib.pyplot as plt
+from mpl_toolkits import mplot3d
+import numpy as np
+from dibujo import BatchRenderer
+from malla import MeshBatch
+from rotaciones import RotZ_batch
+from instrumentacion import FrameTimer
+
+# ------------------ Tarima de cajas ------------------
+# K cajas en una rejilla, cada una girando sobre su eje z a su propia
+# velocidad. Todas las poses (K,4,4) se calculan en una pasada, los
+# vértices (K,8,3) con un solo producto por lotes y todas las aristas se
+# dibujan con un solo artista (BatchRenderer).
+#
+#   python Box3D_AnimacionTarima.py 5000
+
+# create the fig and ax objects to handle figure and axes of the fixed frame
+fig,ax = plt.subplots()
+ax = plt.axes(projection = "3d")
+
+
+def pallet(n_boxes, spacing=10):
+    # Centros de una rejilla casi cuadrada de n_boxes cajas en el plano xy,
+    # en capas de 2 de alto
+    per_layer = int(np.ceil(n_boxes / 2))
+    side = int(np.ceil(np.sqrt(per_layer)))
+    k = np.arange(n_boxes)
+    layer, cell = np.divmod(k, per_layer)
+    x, y = np.divmod(cell, side)
+    centers = np.stack([x, y, 0*x], axis=1)*spacing
+    centers[:, 2] = layer*4
+    return centers - [side*spacing/2, side*spacing/2, 0]
+
+
+def animate(n_boxes=5000, steps=90):
+    rng = np.random.default_rng(0)
+    centers = pallet(n_boxes)
+    sizes = rng.uniform(0.6, 1.0, (n_boxes, 1))*[7, 2, 3]
+    rates = rng.uniform(-4, 4, n_boxes)           # grados por cuadro
+
+    # las cajas giran alrededor de su propio centro
+    boxes = MeshBatch.boxes(sizes)
+    boxes.vertices -= sizes[:, None, :]/2
+
+    poses = np.tile(np.eye(4), (n_boxes, 1, 1))
+    poses[:, :3, 3] = centers
+    boxes.update(poses)
+
+    R = np.abs(centers).max() + 5
+    ax.set_xlim3d(-R, R)
+    ax.set_ylim3d(-R, R)
+    ax.set_zlim3d(-R, R)
+    ax.view_init(elev=30, azim=40)
+    scene = BatchRenderer(ax, boxes, color='red')
+
+    # tiempos por cuadro (solo con ROBOTICA_TIMING=1)
+    timer = FrameTimer.from_env(interval=0.05, name=f"tarima x{n_boxes}")
+
+    for n in range(steps):
+        with timer.frame():
+            with timer.phase("kinematics"):
+                poses[:, :3, :3] = RotZ_batch(rates*n)
+                scene.update(poses)
+            with timer.phase("draw"):
+                plt.draw()
+            with timer.phase("pause"):
+                plt.pause(0.05)
+
+    timer.finish()
+
+
+# Llamar la animación
+animate(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
+plt.draw()
+plt.show()
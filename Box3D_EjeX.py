@@ -2,6 +2,7 @@
 import matplotlib.pyplot as plt
 from mpl_toolkits import mplot3d
 import numpy as np
+from rotaciones import RotX
 
 # create the fig and ax objects to handle figure and axes of the fixed frame
 fig,ax = plt.subplots()
@@ -42,31 +43,6 @@ def fix_system(axis_length, linewidth=5):
     ax.plot3D(zp, zp, z, color='green',linewidth=linewidth)
     
 
-def sind(t):
-    # sind function
-    # Computes the sin() trigonometric function in degrees
-    # ----------------------------------------------------------------------
-    # Arguments
-    # t -> Numeric, angle in degrees. 
-    # ----------------------------------------------------------------------
-    res = np.sin(t*np.pi/180)
-    return res
-
-def cosd(t):
-    # sind function
-    # Computes the cos() trigonometric function in degrees
-    # ----------------------------------------------------------------------
-    # Arguments
-    # t -> Numeric, angle in degrees. 
-    # ----------------------------------------------------------------------
-    res = np.cos(t*np.pi/180)
-    return res
-
-
-def RotX(t):
-    Rx = np.array(([1,0,0],[0,cosd(t),-sind(t)],[0,sind(t),cosd(t)]))
-    return Rx
-
 def drawVector(p_fin, p_init=[0,0,0], color='black',linewidth=1):
     deltaX = [p_init[0], p_fin[0]]
     deltaY = [p_init[1], p_fin[1]]
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from brazo2r import compute_trajectory
+from instrumentacion import FrameTimer
 
 # ------------------ CINEMÁTICA INVERSA ------------------
 
@@ -40,29 +42,10 @@ def fk_2r(L1, L2, theta1_deg, theta2_deg):
 
 # ------------------ ANIMACIÓN ------------------
 
-def animate_arm(L1, L2, x_target, y_target, elbow='up', steps=100):
-    ik_result = ik_2r(L1, L2, x_target, y_target, elbow)
-    if ik_result is None:
-        print("Objetivo fuera del alcance")
-        return
-    
-    theta1_end, theta2_end = ik_result
-
-    # Trayectoria lineal del efector
-    x_traj = np.linspace(L1 + L2, x_target, steps)
-    y_traj = np.linspace(0, y_target, steps)
-
-    # Guardar ángulos para cada paso
-    theta1_vals = []
-    theta2_vals = []
-
-    for x, y in zip(x_traj, y_traj):
-        res = ik_2r(L1, L2, x, y, elbow)
-        if res is None:
-            print(f"Punto ({x:.2f},{y:.2f}) fuera del alcance")
-            return
-        theta1_vals.append(res[0])
-        theta2_vals.append(res[1])
+def play_arm(traj, interval=30):
+    # Etapa de reproducción: solo actualiza los artistas con la
+    # trayectoria ya calculada por compute_trajectory
+    L1, L2 = traj.L1, traj.L2
 
     # Configurar figura
     fig = plt.figure(figsize=(6,6))
@@ -73,17 +56,37 @@ def animate_arm(L1, L2, x_target, y_target, elbow='up', steps=100):
     ax.set_xlabel('X'); ax.set_ylabel('Y'); ax.set_zlabel('Z')
 
     line, = ax.plot([], [], [], 'o-', lw=3, markersize=8, color='blue')
-    target_dot = ax.scatter([x_target], [y_target], [0], marker='x', s=100, c='red')
+    target_dot = ax.scatter(*[[c] for c in traj.target], marker='x', s=100, c='red')
 
     def update(i):
-        xs, ys = fk_2r(L1, L2, theta1_vals[i], theta2_vals[i])
-        zs = [0,0,0]
+        xs, ys, zs = traj.joints[i].T
         line.set_data(xs, ys)
         line.set_3d_properties(zs)
         return line,
 
-    anim = FuncAnimation(fig, update, frames=steps, interval=30, blit=False)
+    # tiempos por cuadro (solo con ROBOTICA_TIMING=1)
+    timer = FrameTimer.from_env(interval=interval/1000, name="play_arm")
+
+    anim = FuncAnimation(fig, timer.wrap(update), frames=len(traj), interval=interval, blit=False)
     plt.show()
+    timer.finish()
+
+
+def animate_arm(L1, L2, x_target, y_target, elbow='up', steps=100, tol=None):
+    ik_result = ik_2r(L1, L2, x_target, y_target, elbow)
+    if ik_result is None:
+        print("Objetivo fuera del alcance")
+        return
+
+    # Trayectoria lineal del efector, calculada completa antes de dibujar
+    traj = compute_trajectory(L1, L2, x_target, y_target, elbow, steps, tol=tol)
+    i = traj.first_unreachable()
+    if i is not None:
+        x, y = traj.path[i, :2]
+        print(f"Punto ({x:.2f},{y:.2f}) fuera del alcance")
+        return
+
+    play_arm(traj)
 
 # ------------------ LOOP INTERACTIVO ------------------
 
@@ -2,6 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from instrumentacion import FrameTimer
+from brazo2r import ik_2r_batch
 
 # ------------------ Robot SCARA ------------------
 class SCARARobotAlt:
@@ -12,8 +14,9 @@ class SCARARobotAlt:
         self.base_h = base_h
         self.platillo_r = platillo_r
 
-    def forward_kinematics(self, theta2_deg, piston_h, theta3_deg):
-        th1, th2 = self.theta1, np.deg2rad(theta2_deg)
+    def forward_kinematics(self, theta2_deg, piston_h, theta3_deg, theta1_deg=None):
+        th1 = self.theta1 if theta1_deg is None else np.deg2rad(theta1_deg)
+        th2 = np.deg2rad(theta2_deg)
 
         # Puntos principales
         p_base = np.array([0,0,0])
@@ -46,14 +49,83 @@ class SCARARobotAlt:
 
         return p_base, p_eje, p1, p2, p_top, hx, hy, hz
 
+    def inverse_kinematics(self, x, y, z, yaw_deg=0, elbow='up', piston_limits=None):
+        # Cinemática inversa cerrada y vectorizada
+        # ------------------------------------------------------------------
+        # Arguments
+        # x, y, z  -> array-like (N,), posición del centro del platillo
+        # yaw_deg  -> giro del platillo alrededor de Z (grados)
+        # elbow    -> 'up', 'down' o 'both', como en ik_2r_batch
+        # piston_limits -> (min, max) de altura del pistón, opcional
+        # Returns
+        # theta1, theta2, piston_h, theta3 -> (N,) o (2,N) con elbow='both'
+        #                                     (fila 0 = 'up', fila 1 = 'down');
+        #                                     NaN donde reachable es False
+        # reachable -> máscara booleana (N,)
+        # ------------------------------------------------------------------
+        # El brazo es un 2R en el plano XY; el pistón da la altura y el
+        # platillo gira directamente con theta3
+        theta1, theta2, reachable = ik_2r_batch(self.L1, self.L2, x, y, elbow)
+        z = np.asarray(z, dtype=float)
+        if piston_limits is not None:
+            reachable = reachable & (z >= piston_limits[0]) & (z <= piston_limits[1])
+
+        piston_h = np.where(reachable, np.broadcast_to(z, theta2.shape), np.nan)
+        theta3 = np.where(reachable, np.broadcast_to(np.asarray(yaw_deg, dtype=float),
+                                                     theta2.shape), np.nan)
+        return theta1, theta2, piston_h, theta3, reachable
+
+    def forward_kinematics_batch(self, theta2_seq, piston_seq, theta3_seq, theta1_seq=None):
+        # forward_kinematics para secuencias completas de N cuadros.
+        # Regresa lo mismo que forward_kinematics con un eje extra al inicio:
+        # p_base, p_eje, p1, p2, p_top -> (N,3) y hx, hy, hz -> (N,4)
+        th2 = np.deg2rad(np.asarray(theta2_seq, dtype=float))
+        if theta1_seq is None:
+            th1 = np.full_like(th2, self.theta1)
+        else:
+            th1 = np.deg2rad(np.asarray(theta1_seq, dtype=float))
+        N = len(th2)
+
+        p_base = np.zeros((N, 3))
+        p_eje = np.zeros((N, 3))
+        p_eje[:, 2] = self.base_h
+
+        p1 = np.empty((N, 3))
+        p1[:, 0] = self.L1*np.cos(th1)
+        p1[:, 1] = self.L1*np.sin(th1)
+        p1[:, 2] = self.base_h
+
+        p2 = np.empty((N, 3))
+        p2[:, 0] = p1[:, 0] + self.L2*np.cos(th1 + th2)
+        p2[:, 1] = p1[:, 1] + self.L2*np.sin(th1 + th2)
+        p2[:, 2] = self.base_h
+
+        p_top = p2.copy()
+        p_top[:, 2] = piston_seq
+
+        # Cuadrado del platillo rotado: (N,4) por coordenada
+        angle = np.deg2rad(np.asarray(theta3_seq, dtype=float))[:, None]
+        cx = np.array([-1, 1, 1, -1]) * self.platillo_r
+        cy = np.array([-1, -1, 1, 1]) * self.platillo_r
+        c, s = np.cos(angle), np.sin(angle)
+        hx = p_top[:, :1] + cx*c - cy*s
+        hy = p_top[:, 1:2] + cx*s + cy*c
+        hz = np.repeat(p_top[:, 2:], 4, axis=1)
+
+        return p_base, p_eje, p1, p2, p_top, hx, hy, hz
+
 # ------------------ Animación ------------------
 class SCARASimulatorAlt:
-    def __init__(self, robot, theta2_seq, piston_seq, theta3_seq):
+    def __init__(self, robot, theta2_seq, piston_seq, theta3_seq, theta1_seq=None):
         self.robot = robot
         self.theta2_seq = theta2_seq
         self.piston_seq = piston_seq
         self.theta3_seq = theta3_seq
 
+        # Geometría de todos los cuadros calculada de una vez
+        self.geometry = robot.forward_kinematics_batch(theta2_seq, piston_seq,
+                                                       theta3_seq, theta1_seq)
+
         self.fig = plt.figure(figsize=(10,8))
         self.ax = self.fig.add_subplot(111, projection='3d')
         self.ax.set_xlim(-2000, 2000)
@@ -73,7 +145,7 @@ class SCARASimulatorAlt:
         }
 
         # Crear platillo
-        _, _, _, _, p_top, hx, hy, hz = self.robot.forward_kinematics(theta2_seq[0], piston_seq[0], theta3_seq[0])
+        _, _, _, _, p_top, hx, hy, hz = [g[0] for g in self.geometry]
         verts = [list(zip(hx, hy, hz))]
         self.platillo = Poly3DCollection(verts, facecolor='yellow', alpha=0.8)
         self.ax.add_collection3d(self.platillo)
@@ -82,9 +154,7 @@ class SCARASimulatorAlt:
         self.top_marker = self.ax.scatter([p_top[0]], [p_top[1]], [p_top[2]], color='red', s=50)
 
     def update(self, i):
-        p_base, p_eje, p1, p2, p_top, hx, hy, hz = self.robot.forward_kinematics(
-            self.theta2_seq[i], self.piston_seq[i], self.theta3_seq[i]
-        )
+        p_base, p_eje, p1, p2, p_top, hx, hy, hz = [g[i] for g in self.geometry]
 
         # Actualizar líneas
         self.lines['base_eje'].set_data([p_base[0], p_eje[0]], [p_base[1], p_eje[1]])
@@ -109,14 +179,16 @@ class SCARASimulatorAlt:
         return list(self.lines.values()) + [self.platillo, self.top_marker]
 
     def animate(self):
-        ani = FuncAnimation(self.fig, self.update, frames=len(self.theta2_seq),
+        # tiempos por cuadro (solo con ROBOTICA_TIMING=1)
+        timer = FrameTimer.from_env(interval=0.04, name="SCARA")
+        ani = FuncAnimation(self.fig, timer.wrap(self.update, phase="kinematics+artists"),
+                            frames=len(self.theta2_seq),
                             interval=40, blit=False, repeat=False)
         plt.show()
+        timer.finish()
 
-# ------------------ Main ------------------
-if __name__ == "__main__":
-    frames_brazo = 120 
-    frames_piston = 120 
+# ------------------ Secuencia ------------------
+def secuencia_examen(frames_brazo=120, frames_piston=120):
     frames_total = frames_brazo + frames_piston
 
     # Secuencia de theta2: mover de 0 a 90 en la primera fase, luego mantener
@@ -134,6 +206,12 @@ if __name__ == "__main__":
     # Secuencia de rotación 
     theta3_seq = np.linspace(0, 360, frames_total)
 
+    return theta2_seq, piston_seq, theta3_seq
+
+# ------------------ Main ------------------
+if __name__ == "__main__":
+    theta2_seq, piston_seq, theta3_seq = secuencia_examen()
+
     robot = SCARARobotAlt(theta1_deg=30, L1=715, L2=850)
     sim = SCARASimulatorAlt(robot, theta2_seq, piston_seq, theta3_seq)
     sim.animate()
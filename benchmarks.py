@@ -0,0 +1,438 @@
+import os
+import sys
+import json
+import itertools
+import time
+import timeit
+import argparse
+import subprocess
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+# ------------------ Benchmarks ------------------
+# Mide los caminos críticos de cinemática y dibujo sin abrir ventanas.
+# Cada corrida se agrega a un historial JSON (una línea por corrida, con el
+# commit actual) y se compara contra la corrida anterior para detectar
+# regresiones.
+#
+#   python benchmarks.py                  # todo
+#   python benchmarks.py -k rot -k chain  # solo los que contienen el texto
+#   python benchmarks.py --no-save        # no escribir el historial
+
+HISTORY = "bench_history.jsonl"
+
+BENCHMARKS = {}
+
+
+def bench(name):
+    # Registra un benchmark. La función decorada hace la preparación y
+    # regresa la función sin argumentos que se va a medir
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# ------------------ Rotaciones ------------------
+
+@bench("rot.RotX_scalar")
+def _():
+    from rotaciones import RotX
+    return lambda: RotX(17)
+
+
+@bench("rot.RotXYZ_scalar_x1000")
+def _():
+    from rotaciones import RotX, RotY, RotZ
+    angles = np.arange(1000) * 0.37
+
+    def run():
+        for t in angles:
+            RotX(t) @ RotY(t) @ RotZ(t)
+    return run
+
+
+@bench("rot.RotXYZ_batch_x1000")
+def _():
+    from rotaciones import RotX_batch, RotY_batch, RotZ_batch
+    angles = np.arange(1000) * 0.37
+    return lambda: RotX_batch(angles) @ RotY_batch(angles) @ RotZ_batch(angles)
+
+
+@bench("rot.RotX_points_absolute")
+def _():
+    from rotaciones import RotX
+    angles = itertools.count()
+    return lambda: _BOX @ RotX(next(angles)).T
+
+
+@bench("rot.IncrementalRotation_step")
+def _():
+    from rotaciones import IncrementalRotation, RotX
+    return IncrementalRotation(_BOX, RotX(1)).step
+
+
+@bench("rot.move_and_rotate_Box_dot")
+def _():
+    # Igual que Matriz_Transformada&Rotacion.py: 8 vectores homogéneos y .dot()
+    from transformaciones import TRz, TTx
+    M = TTx(4) @ TRz(45)
+    points = [list(p) for p in _BOX]
+
+    def run():
+        [M.dot(np.array([p[0], p[1], p[2], 1]))[:3] for p in points]
+    return run
+
+
+@bench("rot.RigidMesh_transform")
+def _():
+    from malla import RigidMesh
+    from rotaciones import RotZ
+    box, R = RigidMesh.box(), RotZ(45)
+    return lambda: box.transform(R, [4, 0, 0])
+
+
+@bench("rot.quat_slerp_x1000")
+def _():
+    import cuaterniones as cq
+    a, b = cq.qx(10), cq.multiply(cq.qy(80), cq.qz(35))
+    t = np.linspace(0, 1, 1000)
+    return lambda: cq.to_matrix(cq.slerp(a, b, t))
+
+
+# ------------------ Cadena de EXAMEN.py ------------------
+
+@bench("chain.TRz_TTx_dot")
+def _():
+    from transformaciones import TRz, TTx
+
+    def run(n=17, l1=15, l2=5, l3=7):
+        TRz(n).dot(TTx(l1)).dot(TRz(n)).dot(TTx(l2)).dot(TRz(n)).dot(TTx(l3))
+    return run
+
+
+@bench("chain.RigidTransform")
+def _():
+    from transformaciones import RigidTransform
+
+    def run(n=17, l1=15, l2=5, l3=7):
+        RigidTransform().rotate_z(n).translate_x(l1).rotate_z(n) \
+            .translate_x(l2).rotate_z(n).translate_x(l3)
+    return run
+
+
+@bench("chain.compose_chain_x1000")
+def _():
+    from transformaciones import TRz_batch, TTx, compose_chain
+    angles = np.arange(1000) * 0.03
+
+    def run():
+        R = TRz_batch(angles)
+        compose_chain([R, TTx(15), R, TTx(5), R, TTx(7)])
+    return run
+
+
+@bench("chain.SceneGraph_root_x6")
+def _():
+    # Segundo ciclo de EXAMEN.py: solo cambia la raíz y se leen los 6 marcos
+    from escena import SceneGraph
+    from transformaciones import TRx, TRz, TTx
+    names = ["T1", "T12", "T123", "T1234", "T12345", "T123456"]
+    scene = SceneGraph()
+    scene.add_chain(names, [TRz(30), TTx(15), TRz(30), TTx(5), TRz(30), TTx(7)])
+    out = np.empty((6, 4, 4))
+    angles = itertools.count()
+
+    def run():
+        scene.set_local("root", TRx(next(angles) % 31))
+        scene.worlds(names, out=out)
+    return run
+
+
+@bench("chain.SceneGraph_tool_jog")
+def _():
+    # Una herramienta colgada del último eslabón: solo se recalcula su rama
+    from escena import SceneGraph
+    from transformaciones import TRz, TTx
+    names = ["T1", "T12", "T123", "T1234", "T12345", "T123456"]
+    scene = SceneGraph()
+    scene.add_chain(names, [TRz(30), TTx(15), TRz(30), TTx(5), TRz(30), TTx(7)])
+    scene.add("tool", TRz(0), parent="T123456")
+    angles = itertools.count()
+
+    def run():
+        scene.set_local("tool", TRz(next(angles) % 360))
+        scene.world("tool")
+    return run
+
+
+# ------------------ angulos.py ------------------
+
+@bench("dh.A_DH")
+def _():
+    from angulos import A_DH
+    return lambda: A_DH(30, 0, 5, 0)
+
+
+@bench("dh.frames_2R")
+def _():
+    from angulos import frames_2R
+    return lambda: frames_2R(30, 45, 5, 3)
+
+
+@bench("dh.DHChain_6dof_jog")
+def _():
+    from cadena_dh import DHChain
+    chain = DHChain(np.tile([[0, 0.1, 0.5, 90]], (6, 1)), "RRRRRR")
+    values = itertools.count()
+
+    def run():
+        chain.set_joint(5, next(values) * 0.1)
+        chain.current_frames()
+    return run
+
+
+@bench("dh.DHChain_6dof_batch_x1000")
+def _():
+    from cadena_dh import DHChain
+    chain = DHChain(np.tile([[0, 0.1, 0.5, 90]], (6, 1)), "RRRRRR")
+    q = np.random.default_rng(0).uniform(-180, 180, (1000, 6))
+    return lambda: chain.frames(q)
+
+
+@bench("dh.jacobian_6dof_x1000")
+def _():
+    from cadena_dh import DHChain
+    chain = DHChain(np.tile([[0, 0.1, 0.5, 90]], (6, 1)), "RRRRRR")
+    q = np.random.default_rng(0).uniform(-180, 180, (1000, 6))
+    return lambda: chain.jacobian(q)
+
+
+# ------------------ Robot 2R ------------------
+
+@bench("2r.ik_2r")
+def _():
+    from Codos import ik_2r
+    return lambda: ik_2r(7, 4, 5, 6)
+
+
+@bench("2r.fk_2r")
+def _():
+    from Codos import fk_2r
+    return lambda: fk_2r(7, 4, 30, 45)
+
+
+@bench("2r.ik_2r_batch_x10000")
+def _():
+    from brazo2r import ik_2r_batch
+    x, y = np.random.default_rng(0).uniform(-11, 11, (2, 10000))
+    return lambda: ik_2r_batch(7, 4, x, y)
+
+
+@bench("2r.fk_2r_batch_x10000")
+def _():
+    from brazo2r import fk_2r_batch
+    t1, t2 = np.random.default_rng(0).uniform(-180, 180, (2, 10000))
+    return lambda: fk_2r_batch(7, 4, t1, t2)
+
+
+# ------------------ SCARA ------------------
+
+@bench("scara.forward_kinematics")
+def _():
+    from EXAMENFINAL import SCARARobotAlt
+    robot = SCARARobotAlt(theta1_deg=30, L1=715, L2=850)
+    return lambda: robot.forward_kinematics(45, 700, 30)
+
+
+@bench("scara.forward_kinematics_batch_x240")
+def _():
+    from EXAMENFINAL import SCARARobotAlt, secuencia_examen
+    robot = SCARARobotAlt(theta1_deg=30, L1=715, L2=850)
+    seqs = secuencia_examen()
+    return lambda: robot.forward_kinematics_batch(*seqs)
+
+
+# ------------------ Dibujo (Agg) ------------------
+
+def _box_axes():
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection="3d")
+    ax.set_xlim3d(-15, 15)
+    ax.set_ylim3d(-15, 15)
+    ax.set_zlim3d(-15, 15)
+    return fig, ax
+
+
+_BOX = np.array([[0, 0, 0], [7, 0, 0], [7, 0, 3], [0, 0, 3],
+                 [0, 2, 0], [7, 2, 0], [7, 2, 3], [0, 2, 3]], dtype=float)
+
+
+@bench("frame.drawBox_cla")
+def _():
+    # Igual que los scripts Box3D: ax.cla() y 8 scatter + 12 plot3D por cuadro
+    from dibujo import BOX_EDGES
+    fig, ax = _box_axes()
+
+    def run():
+        ax.cla()
+        ax.set_xlim3d(-15, 15)
+        ax.set_ylim3d(-15, 15)
+        ax.set_zlim3d(-15, 15)
+        for p in _BOX:
+            ax.scatter(p[0], p[1], p[2], marker="o")
+        for i, j in BOX_EDGES:
+            ax.plot3D(*_BOX[[i, j]].T, color="red", linewidth=1)
+        fig.canvas.draw()
+    return run
+
+
+@bench("frame.BoxRenderer")
+def _():
+    from dibujo import BoxRenderer
+    fig, ax = _box_axes()
+    box = BoxRenderer(ax, _BOX, color="red")
+
+    def run():
+        box.update(_BOX)
+        fig.canvas.draw()
+    return run
+
+
+def _pallet(k=5000):
+    from malla import MeshBatch
+    rng = np.random.default_rng(0)
+    poses = np.tile(np.eye(4), (k, 1, 1))
+    poses[:, :3, 3] = rng.uniform(-200, 200, (k, 3))
+    return MeshBatch.boxes(rng.uniform(0.6, 1.0, (k, 1))*[7, 2, 3], poses), poses
+
+
+@bench("rot.MeshBatch_update_x5000")
+def _():
+    from rotaciones import RotZ_batch
+    boxes, poses = _pallet()
+    angles = itertools.count()
+
+    def run():
+        poses[:, :3, :3] = RotZ_batch(np.full(len(poses), next(angles)))
+        boxes.update(poses)
+        boxes.segments()
+    return run
+
+
+@bench("frame.BatchRenderer_x5000")
+def _():
+    from dibujo import BatchRenderer
+    fig, ax = _box_axes()
+    boxes, poses = _pallet()
+    scene = BatchRenderer(ax, boxes)
+
+    def run():
+        scene.update(poses)
+        fig.canvas.draw()
+    return run
+
+
+@bench("frame.SCARASimulatorAlt_update")
+def _():
+    from EXAMENFINAL import SCARARobotAlt, SCARASimulatorAlt, secuencia_examen
+    robot = SCARARobotAlt(theta1_deg=30, L1=715, L2=850)
+    sim = SCARASimulatorAlt(robot, *secuencia_examen())
+    frame = itertools.count()
+
+    def run():
+        sim.update(next(frame) % len(sim.theta2_seq))
+        sim.fig.canvas.draw()
+    return run
+
+
+# ------------------ Ejecución ------------------
+
+def measure(fn, min_time=0.2, repeat=3):
+    # Mejor tiempo por operación (segundos) de varias repeticiones
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_last(path):
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        lines = [l for l in f if l.strip()]
+    return json.loads(lines[-1]) if lines else None
+
+
+def run(filters=(), min_time=0.2):
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if filters and not any(k in name for k in filters):
+            continue
+        fn = setup()
+        results[name] = measure(fn, min_time)
+        plt.close("all")
+    return results
+
+
+def report(results, previous=None, threshold=0.10):
+    # Imprime tiempo por operación, ops/s y el cambio contra la corrida
+    # anterior; regresa los nombres que empeoraron más que threshold
+    prev = (previous or {}).get("results", {})
+    regressions = []
+    print(f"{'benchmark':34s} {'tiempo':>12s} {'ops/s':>12s} {'cambio':>9s}")
+    for name, t in results.items():
+        if t >= 1e-3:
+            shown = f"{t*1e3:9.2f} ms"
+        else:
+            shown = f"{t*1e6:9.2f} us"
+        change = ""
+        if name in prev:
+            delta = t / prev[name] - 1
+            change = f"{delta*100:+8.1f}%"
+            if delta > threshold:
+                regressions.append(name)
+                change += " !"
+        print(f"{name:34s} {shown:>12s} {1/t:12.1f} {change:>9s}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks de cinemática y dibujo")
+    parser.add_argument("-k", action="append", default=[], help="filtrar por nombre")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="fracción de empeoramiento que cuenta como regresión")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    previous = load_last(args.history)
+    results = run(args.k, args.min_time)
+    if previous:
+        print(f"comparando contra {previous.get('commit')} ({previous.get('date')})")
+    regressions = report(results, previous, args.threshold)
+
+    if not args.no_save:
+        entry = {"commit": git_commit(),
+                 "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                 "python": sys.version.split()[0],
+                 "numpy": np.__version__,
+                 "results": results}
+        with open(args.history, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    if regressions:
+        print(f"{len(regressions)} regresiones: {', '.join(regressions)}")
+        sys.exit(1)
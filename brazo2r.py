@@ -0,0 +1,215 @@
+import numpy as np
+
+# ------------------ Robot 2R sin gráficas ------------------
+# Cinemática vectorizada del brazo de dos eslabones de Codos.py (plano XY)
+# y codos2.py (plano YZ). Este módulo no importa matplotlib para poder
+# usarse en barridos y validaciones sin pantalla.
+
+# ------------------ CINEMÁTICA INVERSA ------------------
+
+def ik_2r_batch(L1, L2, x, y, elbow='up'):
+    # Resuelve N objetivos a la vez con la ley de cosenos
+    # ----------------------------------------------------------------------
+    # Arguments
+    # L1, L2 -> longitudes de los eslabones
+    # x, y   -> array-like (N,), coordenadas de los objetivos
+    # elbow  -> 'up', 'down' o 'both'
+    # Returns
+    # theta1, theta2 -> ángulos en grados, (N,) o (2,N) con elbow='both'
+    #                   (fila 0 = 'up', fila 1 = 'down'); NaN si el punto
+    #                   está fuera de alcance
+    # reachable      -> máscara booleana (N,) con el test del anillo
+    # ----------------------------------------------------------------------
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    r2 = x**2 + y**2
+    L_sum = L1 + L2
+    L_diff = abs(L1 - L2)
+    reachable = (r2 <= L_sum**2) & (r2 >= L_diff**2)
+
+    # Ley de cosenos
+    cos_theta2 = (r2 - L1**2 - L2**2) / (2 * L1 * L2)
+    theta2 = np.arccos(np.clip(cos_theta2, -1, 1))
+    theta2 = np.where(reachable, theta2, np.nan)
+
+    if elbow == 'both':
+        theta2 = np.stack([theta2, -theta2])
+    elif elbow == 'down':
+        theta2 = -theta2
+
+    k1 = L1 + L2 * np.cos(theta2)
+    k2 = L2 * np.sin(theta2)
+    theta1 = np.arctan2(y, x) - np.arctan2(k2, k1)
+
+    return np.degrees(theta1), np.degrees(theta2), reachable
+
+
+def ik_2r_yz_batch(L1, L2, y, z, elbow='up'):
+    # Igual que ik_2r_batch pero para el brazo en el plano YZ de codos2.py
+    return ik_2r_batch(L1, L2, y, z, elbow)
+
+
+# ------------------ CINEMÁTICA DIRECTA ------------------
+
+def fk_2r_batch(L1, L2, theta1_deg, theta2_deg):
+    # Posiciones de las articulaciones para N configuraciones
+    # ----------------------------------------------------------------------
+    # Arguments
+    # theta1_deg, theta2_deg -> array-like (N,), ángulos en grados
+    # Returns
+    # arreglo (N,3,2): [base, codo, efector] x [x, y]
+    # ----------------------------------------------------------------------
+    t1 = np.radians(np.asarray(theta1_deg, dtype=float))
+    t12 = t1 + np.radians(np.asarray(theta2_deg, dtype=float))
+    t1, t12 = np.broadcast_arrays(t1, t12)
+
+    P = np.zeros(t1.shape + (3, 2))
+    P[..., 1, 0] = L1 * np.cos(t1)
+    P[..., 1, 1] = L1 * np.sin(t1)
+    P[..., 2, 0] = P[..., 1, 0] + L2 * np.cos(t12)
+    P[..., 2, 1] = P[..., 1, 1] + L2 * np.sin(t12)
+    return P
+
+
+def fk_2r_yz_batch(L1, L2, th1_deg, th2_deg):
+    # Igual que fk_2r_batch para el plano YZ: regresa (N,3,3) con x = 0
+    P2 = fk_2r_batch(L1, L2, th1_deg, th2_deg)
+    P = np.zeros(P2.shape[:-1] + (3,))
+    P[..., 1:] = P2
+    return P
+
+
+# ------------------ TRAYECTORIAS ------------------
+
+class Trajectory2R:
+    # Resultado de la etapa de cálculo: todo lo que la reproducción necesita
+    # ----------------------------------------------------------------------
+    # theta1, theta2 -> ángulos en grados por paso, (N,)
+    # joints         -> posiciones 3D [base, codo, efector] por paso, (N,3,3)
+    # reachable      -> máscara booleana (N,) de puntos alcanzables
+    # path           -> puntos 3D pedidos al efector, (N,3)
+    # target         -> punto objetivo 3D
+    # ----------------------------------------------------------------------
+    def __init__(self, L1, L2, theta1, theta2, joints, reachable, path, target, plane='xy'):
+        self.L1 = L1
+        self.L2 = L2
+        self.theta1 = theta1
+        self.theta2 = theta2
+        self.joints = joints
+        self.reachable = reachable
+        self.path = path
+        self.target = target
+        self.plane = plane
+
+    def __len__(self):
+        return len(self.theta1)
+
+    @property
+    def ok(self):
+        return bool(self.reachable.all())
+
+    def first_unreachable(self):
+        # Índice del primer punto fuera de alcance, o None
+        if self.ok:
+            return None
+        return int(np.argmin(self.reachable))
+
+
+def adaptive_path_samples(L1, L2, start, end, elbow='up', tol=1e-2,
+                          initial=2, max_depth=16):
+    # Elige los parámetros u en [0, 1] de la recta start -> end de modo que
+    # interpolar linealmente en espacio articular entre muestras vecinas se
+    # desvíe de la recta cartesiana menos que tol. En cada ronda se evalúa
+    # con IK/FK por lotes el punto medio de todos los intervalos abiertos y
+    # solo se dividen los que exceden la tolerancia.
+    # ----------------------------------------------------------------------
+    # Arguments
+    # start, end -> puntos (a, b) inicial y final en el plano del brazo
+    # tol        -> desviación cartesiana máxima entre muestras
+    # initial    -> intervalos iniciales uniformes
+    # max_depth  -> rondas máximas de subdivisión
+    # Returns
+    # u -> (M,) parámetros ordenados, con 0 y 1 incluidos
+    # ----------------------------------------------------------------------
+    if elbow not in ('up', 'down'):
+        raise ValueError(f"elbow debe ser 'up' o 'down', no {elbow!r}")
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+
+    def line(u):
+        return start + (end - start)*u[:, None]
+
+    u = np.linspace(0, 1, initial + 1)
+    P = line(u)
+    t1, t2, ok = ik_2r_batch(L1, L2, P[:, 0], P[:, 1], elbow)
+    open_ = np.ones(len(u) - 1, dtype=bool)
+
+    for _ in range(max_depth):
+        k = np.flatnonzero(open_ & ok[:-1] & ok[1:])
+        if k.size == 0:
+            break
+        # punto medio interpolado en articulaciones (con theta1 envuelto)
+        d1 = (t1[k+1] - t1[k] + 180) % 360 - 180
+        m1 = t1[k] + d1/2
+        m2 = (t2[k] + t2[k+1])/2
+        tip = fk_2r_batch(L1, L2, m1, m2)[:, 2]
+        um = (u[k] + u[k+1])/2
+        err = np.linalg.norm(tip - line(um), axis=1)
+
+        open_[:] = False
+        split = err > tol
+        if not split.any():
+            break
+        k, um = k[split], um[split]
+        Pm = line(um)
+        mt1, mt2, mok = ik_2r_batch(L1, L2, Pm[:, 0], Pm[:, 1], elbow)
+
+        # inserta los puntos nuevos; los dos intervalos hijos quedan abiertos
+        u = np.concatenate([u, um])
+        t1 = np.concatenate([t1, mt1])
+        t2 = np.concatenate([t2, mt2])
+        ok = np.concatenate([ok, mok])
+        is_new = np.zeros(len(u), dtype=bool)
+        is_new[-len(um):] = True
+        order = np.argsort(u, kind='stable')
+        u, t1, t2, ok, is_new = u[order], t1[order], t2[order], ok[order], is_new[order]
+        open_ = is_new[:-1] | is_new[1:]
+
+    return u
+
+
+def compute_trajectory(L1, L2, target_a, target_b, elbow='up', steps=100, plane='xy',
+                       tol=None):
+    # Etapa de cálculo: trayectoria lineal del efector desde (L1+L2, 0)
+    # hasta el objetivo, resuelta con IK y FK en una sola pasada
+    # ----------------------------------------------------------------------
+    # Arguments
+    # target_a, target_b -> objetivo en el plano (x,y) o (y,z)
+    # plane              -> 'xy' (Codos.py) o 'yz' (codos2.py)
+    # tol                -> si se da, las muestras se eligen con
+    #                       adaptive_path_samples en lugar de usar steps
+    #                       puntos uniformes
+    # elbow              -> 'up' o 'down'; una trayectoria sigue una sola rama
+    # ----------------------------------------------------------------------
+    if elbow not in ('up', 'down'):
+        raise ValueError(f"elbow debe ser 'up' o 'down', no {elbow!r}")
+    if tol is None:
+        u = np.linspace(0, 1, steps)
+    else:
+        u = adaptive_path_samples(L1, L2, (L1 + L2, 0), (target_a, target_b), elbow, tol)
+    steps = len(u)
+    a_traj = (L1 + L2) + (target_a - (L1 + L2))*u
+    b_traj = target_b*u
+    theta1, theta2, reachable = ik_2r_batch(L1, L2, a_traj, b_traj, elbow)
+    path = np.zeros((steps, 3))
+    if plane == 'yz':
+        joints = fk_2r_yz_batch(L1, L2, theta1, theta2)
+        path[:, 1], path[:, 2] = a_traj, b_traj
+    else:
+        joints = np.zeros((steps, 3, 3))
+        joints[..., :2] = fk_2r_batch(L1, L2, theta1, theta2)
+        path[:, 0], path[:, 1] = a_traj, b_traj
+
+    return Trajectory2R(L1, L2, theta1, theta2, joints, reachable,
+                        path, path[-1].copy(), plane)
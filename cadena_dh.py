@@ -0,0 +1,377 @@
+import math
+import numpy as np
+
+# ------------------ Cadenas Denavit–Hartenberg ------------------
+# Generalización de A_DH/frames_2R de angulos.py a N articulaciones,
+# revolutas ('R') o prismáticas ('P'). Los ángulos van en grados, igual que
+# en A_DH.
+
+
+def A_DH_batch(theta, d, a, alpha):
+    # A_DH vectorizada: cada argumento es escalar o arreglo con la misma
+    # forma (...); regresa (..., 4, 4)
+    theta, d, a, alpha = np.broadcast_arrays(*[np.asarray(v, dtype=float)
+                                               for v in (theta, d, a, alpha)])
+    ct, st = np.cos(np.deg2rad(theta)), np.sin(np.deg2rad(theta))
+    ca, sa = np.cos(np.deg2rad(alpha)), np.sin(np.deg2rad(alpha))
+    A = np.zeros(theta.shape + (4, 4))
+    A[..., 0, 0] = ct
+    A[..., 0, 1] = -st*ca
+    A[..., 0, 2] = st*sa
+    A[..., 0, 3] = a*ct
+    A[..., 1, 0] = st
+    A[..., 1, 1] = ct*ca
+    A[..., 1, 2] = -ct*sa
+    A[..., 1, 3] = a*st
+    A[..., 2, 1] = sa
+    A[..., 2, 2] = ca
+    A[..., 2, 3] = d
+    A[..., 3, 3] = 1
+    return A
+
+
+def _fill_A_DH(A, theta, d, a, alpha):
+    # Escribe A_DH de un solo eslabón en el arreglo (4,4) A, sin crear
+    # arreglos nuevos
+    ct, st = math.cos(math.radians(theta)), math.sin(math.radians(theta))
+    ca, sa = math.cos(math.radians(alpha)), math.sin(math.radians(alpha))
+    A[0, 0], A[0, 1], A[0, 2], A[0, 3] = ct, -st*ca, st*sa, a*ct
+    A[1, 0], A[1, 1], A[1, 2], A[1, 3] = st, ct*ca, -ct*sa, a*st
+    A[2, 1], A[2, 2], A[2, 3] = sa, ca, d
+
+
+class DHChain:
+    # Cadena serial definida por una tabla DH
+    # ----------------------------------------------------------------------
+    # Arguments
+    # table -> (dof, 4) con (theta, d, a, alpha) por eslabón; para una
+    #          articulación revoluta q se suma a theta y para una prismática
+    #          q se suma a d
+    # types -> cadena o lista con 'R'/'P' por articulación, p. ej. "RRPR"
+    # base  -> transformación (4,4) de la base, identidad por defecto
+    # ----------------------------------------------------------------------
+    # frames(q) y origins(q) aceptan una configuración (dof,) o un lote
+    # (N, dof) y calculan todo en una pasada. Para mover una articulación a
+    # la vez (jogging) se usa set_joint(): solo se recalcula la matriz de
+    # ese eslabón y el producto de los marcos que quedan después de él.
+    def __init__(self, table, types, base=None):
+        self.table = np.asarray(table, dtype=float).reshape(-1, 4)
+        self.types = [t.upper() for t in types]
+        if len(self.types) != len(self.table):
+            raise ValueError("types debe tener una entrada por eslabón")
+        if any(t not in ("R", "P") for t in self.types):
+            raise ValueError("las articulaciones deben ser 'R' o 'P'")
+        self.dof = len(self.table)
+        self.base = np.eye(4) if base is None else np.asarray(base, dtype=float)
+        self._revolute = np.array([t == "R" for t in self.types])
+
+        # estado en caché para una sola configuración
+        self.q = np.zeros(self.dof)
+        self._A = self.link_transforms(self.q)
+        self._G = np.empty((self.dof + 1, 4, 4))
+        self._G[0] = self.base
+        self._dirty = 0
+
+    # ------------------ Lotes ------------------
+
+    def _dh_params(self, q):
+        q = np.asarray(q, dtype=float)
+        theta = self.table[:, 0] + np.where(self._revolute, q, 0)
+        d = self.table[:, 1] + np.where(self._revolute, 0, q)
+        return theta, d, self.table[:, 2], self.table[:, 3]
+
+    def link_transforms(self, q):
+        # Matrices A_i de cada eslabón: (dof,) -> (dof,4,4), (N,dof) -> (N,dof,4,4)
+        theta, d, a, alpha = self._dh_params(q)
+        return A_DH_batch(theta, d, a, alpha)
+
+    def frames(self, q):
+        # Marcos G0 = base, G1 = base·A1, ..., Gdof: (..., dof+1, 4, 4)
+        A = self.link_transforms(q)
+        G = np.empty(A.shape[:-3] + (self.dof + 1, 4, 4))
+        G[..., 0, :, :] = self.base
+        for k in range(self.dof):
+            np.matmul(G[..., k, :, :], A[..., k, :, :], out=G[..., k + 1, :, :])
+        return G
+
+    def origins(self, q):
+        # Orígenes de todos los marcos: (..., dof+1, 3)
+        return self.frames(q)[..., :3, 3]
+
+    def jacobian(self, q):
+        # Jacobiano geométrico (..., 6, dof) del efector en el marco base.
+        # Filas 0-2: velocidad lineal, filas 3-5: velocidad angular. Las
+        # columnas de articulaciones revolutas están por radián y las de
+        # prismáticas por unidad de longitud.
+        return self._jacobian(self.frames(q))
+
+    def _jacobian(self, G):
+        # Jacobiano a partir de marcos ya calculados (..., dof+1, 4, 4)
+        z = G[..., :-1, :3, 2]                  # ejes z_{i-1}, (..., dof, 3)
+        o = G[..., :-1, :3, 3]                  # orígenes o_{i-1}
+        o_e = G[..., -1:, :3, 3]                # origen del efector
+
+        lin = np.where(self._revolute[:, None], np.cross(z, o_e - o), z)
+        ang = np.where(self._revolute[:, None], z, 0.0)
+        return np.concatenate([np.swapaxes(lin, -1, -2),
+                               np.swapaxes(ang, -1, -2)], axis=-2)
+
+    # ------------------ Configuración en caché ------------------
+
+    def set_joint(self, i, value):
+        # Cambia una articulación y marca como sucios los marcos posteriores
+        if self.q[i] == value:
+            return
+        self.q[i] = value
+        theta, d, a, alpha = self.table[i]
+        if self._revolute[i]:
+            theta += value
+        else:
+            d += value
+        _fill_A_DH(self._A[i], theta, d, a, alpha)
+        self._dirty = min(self._dirty, i)
+
+    def set_joints(self, q):
+        q = np.asarray(q, dtype=float)
+        changed = np.flatnonzero(q != self.q)
+        if changed.size == 0:
+            return
+        self.q[:] = q
+        theta, d, a, alpha = self._dh_params(self.q)
+        self._A[changed] = A_DH_batch(theta[changed], d[changed],
+                                      a[changed], alpha[changed])
+        self._dirty = min(self._dirty, int(changed[0]))
+
+    def current_frames(self):
+        # Marcos de la configuración en caché; solo se recalcula el sufijo
+        # de la cadena a partir de la primera articulación que cambió
+        for k in range(self._dirty, self.dof):
+            np.matmul(self._G[k], self._A[k], out=self._G[k + 1])
+        self._dirty = self.dof
+        return self._G
+
+    def current_origins(self):
+        return self.current_frames()[:, :3, 3]
+
+
+def manipulability(J):
+    # Índice de Yoshikawa sqrt(det(J J^T)) = producto de valores singulares,
+    # para un lote de jacobianos (..., m, n). Para brazos planos conviene
+    # pasar solo las filas de posición, p. ej. J[..., :2, :]
+    sv = np.linalg.svd(J, compute_uv=False)
+    return np.prod(sv, axis=-1)
+
+
+def condition_number(J):
+    # sigma_max / sigma_min por configuración; inf en una singularidad
+    sv = np.linalg.svd(J, compute_uv=False)
+    with np.errstate(divide="ignore"):
+        return np.where(sv[..., -1] > 1e-12*sv[..., 0], sv[..., 0] / sv[..., -1], np.inf)
+
+
+def scara_chain(L1, L2, base_h=776.0):
+    # SCARA de EXAMENFINAL.py como cadena RRPR. Las variables articulares
+    # son (theta1, theta2, piston_h - base_h, theta3): el marco 3 queda a la
+    # altura del pistón y el marco 4 lleva la rotación del platillo
+    return DHChain([[0, base_h, L1, 0],
+                    [0, 0, L2, 0],
+                    [0, 0, 0, 0],
+                    [0, 0, 0, 0]], "RRPR")
+
+
+# ------------------ Cinemática inversa numérica ------------------
+
+def ik_dls(chain, targets, q0=None, rows=(0, 1, 2), limits=None, damping=0.1,
+           tol=1e-6, max_iter=100):
+    # Mínimos cuadrados amortiguados (Levenberg–Marquardt) para un lote de
+    # objetivos de posición. En cada iteración solo se trabaja con los
+    # objetivos que aún no convergen.
+    # ----------------------------------------------------------------------
+    # Arguments
+    # chain   -> DHChain
+    # targets -> (N, len(rows)) posiciones objetivo del efector
+    # q0      -> (N, dof) o (dof,) configuración inicial (ceros por defecto)
+    # rows    -> filas del jacobiano/posición a usar, p. ej. (0, 1) en el plano
+    # limits  -> (dof, 2) límites [min, max] por articulación, opcional
+    # damping -> lambda del amortiguamiento, en unidades de longitud
+    # Returns
+    # q          -> (N, dof) solución
+    # iterations -> (N,) iteraciones usadas por objetivo
+    # residual   -> (N,) error de posición final
+    # converged  -> (N,) máscara booleana
+    # ----------------------------------------------------------------------
+    rows = list(rows)
+    targets = np.asarray(targets, dtype=float).reshape(-1, len(rows))
+    N = len(targets)
+    q = np.zeros((N, chain.dof)) if q0 is None else \
+        np.array(np.broadcast_to(q0, (N, chain.dof)), dtype=float)
+    if limits is not None:
+        limits = np.asarray(limits, dtype=float)
+        q = np.clip(q, limits[:, 0], limits[:, 1])
+
+    # paso en grados para revolutas (el jacobiano está por radián)
+    scale = np.where(chain._revolute, 180/np.pi, 1.0)
+    lam2 = damping**2 * np.eye(len(rows))
+
+    iterations = np.zeros(N, dtype=int)
+    residual = np.full(N, np.inf)
+    active = np.arange(N)
+    for it in range(max_iter + 1):
+        qa = q[active]
+        G = chain.frames(qa)
+        e = targets[active] - G[:, -1, rows, 3]
+        err = np.linalg.norm(e, axis=1)
+        residual[active] = err
+
+        done = err < tol
+        if done.any():
+            active, qa, e, G = active[~done], qa[~done], e[~done], G[~done]
+        if active.size == 0 or it == max_iter:
+            break
+
+        J = chain._jacobian(G)[:, rows, :]
+        JT = np.swapaxes(J, 1, 2)
+        dq = (JT @ np.linalg.solve(J @ JT + lam2, e[..., None]))[..., 0]
+        qa = qa + dq*scale
+        if limits is not None:
+            qa = np.clip(qa, limits[:, 0], limits[:, 1])
+        q[active] = qa
+        iterations[active] += 1
+
+    return q, iterations, residual, residual < tol
+
+
+def ik_dls_trajectory(chain, path, q0=None, stride=8, **kwargs):
+    # Resuelve trayectorias en tres pasos: (1) cada stride puntos se resuelve
+    # un punto clave arrancando desde el clave anterior (warm start), (2) las
+    # soluciones clave se interpolan como semilla de todos los puntos y se
+    # resuelve la trayectoria completa en una sola llamada por lotes, y
+    # (3) los puntos que no convergen se repiten en orden desde el punto
+    # anterior. Varias trayectorias avanzan en paralelo como un solo lote.
+    # ----------------------------------------------------------------------
+    # Arguments
+    # path   -> (T, len(rows)) una trayectoria o (T, K, len(rows)) K trayectorias
+    # q0     -> configuración inicial del primer punto
+    # stride -> separación entre puntos clave; 1 equivale a punto por punto
+    # kwargs se pasan a ik_dls
+    # Returns
+    # q (T, [K,] dof), iterations, residual y converged con forma (T[, K])
+    # ----------------------------------------------------------------------
+    path = np.asarray(path, dtype=float)
+    single = path.ndim == 2
+    if single:
+        path = path[:, None, :]
+    T, K, m = path.shape
+    tol = kwargs.get("tol", 1e-6)
+    start = np.zeros((K, chain.dof)) if q0 is None else \
+        np.array(np.broadcast_to(q0, (K, chain.dof)), dtype=float)
+
+    # (1) puntos clave con arranque en caliente
+    keys = np.unique(np.append(np.arange(0, T, max(int(stride), 1)), T - 1))
+    q_keys = np.empty((len(keys), K, chain.dof))
+    key_iterations = np.zeros((T, K), dtype=int)
+    prev = start
+    for k, t in enumerate(keys):
+        q_keys[k], key_iterations[t], _, _ = ik_dls(chain, path[t], prev, **kwargs)
+        prev = q_keys[k]
+
+    # (2) semilla interpolada entre claves y una sola solución por lotes
+    t = np.arange(T)
+    hi = np.searchsorted(keys, t)                 # primera clave >= t
+    lo = np.where(keys[hi] == t, hi, hi - 1)
+    span = keys[hi] - keys[lo]
+    w = ((t - keys[lo]) / np.where(span == 0, 1, span))[:, None, None]
+    seed = q_keys[lo]*(1 - w) + q_keys[hi]*w
+    q, iterations, residual, converged = ik_dls(chain, path.reshape(-1, m),
+                                                seed.reshape(-1, chain.dof), **kwargs)
+    q = q.reshape(T, K, chain.dof)
+    iterations = iterations.reshape(T, K) + key_iterations
+    residual = residual.reshape(T, K)
+    converged = converged.reshape(T, K)
+
+    # (3) repetir en orden los que fallaron, desde la solución anterior
+    for t in np.flatnonzero(~converged.all(axis=1)):
+        bad = ~converged[t]
+        prev = start if t == 0 else q[t - 1]
+        q[t, bad], it, residual[t, bad], converged[t, bad] = \
+            ik_dls(chain, path[t, bad], prev[bad], **kwargs)
+        iterations[t, bad] += it
+
+    out = q, iterations, residual, residual < tol
+    if single:
+        out = tuple(a[:, 0] for a in out)
+    return out
+
+
+# ------------------ Verificación ------------------
+
+def _check_jacobian(chain, q, h=1e-6):
+    # Compara el jacobiano geométrico contra diferencias finitas centrales;
+    # regresa el error máximo (filas lineales y angulares)
+    J = chain.jacobian(q)
+    # paso en grados para revolutas, el jacobiano está por radián
+    step = np.where(chain._revolute, np.degrees(h), h)
+    J_fd = np.empty_like(J)
+    for i in range(chain.dof):
+        dq = np.zeros(chain.dof)
+        dq[i] = step[i]
+        Gp, Gm = chain.frames(q + dq)[-1], chain.frames(q - dq)[-1]
+        J_fd[:3, i] = (Gp[:3, 3] - Gm[:3, 3]) / (2*h)
+        # velocidad angular: parte antisimétrica de dR R^T
+        W = (Gp[:3, :3] - Gm[:3, :3]) / (2*h) @ chain.frames(q)[-1][:3, :3].T
+        J_fd[3:, i] = [W[2, 1], W[0, 2], W[1, 0]]
+    return np.abs(J - J_fd).max()
+
+
+if __name__ == "__main__":
+    # python cadena_dh.py: comprobaciones numéricas rápidas
+    rng = np.random.default_rng(0)
+
+    arm = DHChain(rng.uniform(-1, 1, (6, 4))*[90, 1, 1, 90], "RRPRPR")
+    for q in rng.uniform(-90, 90, (5, 6)):
+        err = _check_jacobian(arm, q)
+        assert err < 1e-6, f"jacobiano vs diferencias finitas: {err:.2e}"
+
+    scara = scara_chain(715, 850)
+    err = _check_jacobian(scara, np.array([30, 45, -100, 10]))
+    assert err < 1e-4, f"jacobiano SCARA: {err:.2e}"
+
+    # ik_dls sobre el brazo plano de EXAMEN.py (l1=15, l2=5, l3=7): objetivos
+    # generados con cinemática directa deben recuperarse en el plano xy
+    examen = DHChain([[0, 0, 15, 0], [0, 0, 5, 0], [0, 0, 7, 0]], "RRR")
+    q_true = rng.uniform(-120, 120, (200, 3))
+    targets = examen.origins(q_true)[:, -1, :2]
+    q, iterations, residual, converged = ik_dls(examen, targets, q0=[10, 10, 10],
+                                                rows=(0, 1), damping=0.5, max_iter=200)
+    assert converged.mean() > 0.95, f"ik_dls convergió en {converged.mean():.0%}"
+    reached = examen.origins(q[converged])[:, -1, :2]
+    assert np.abs(reached - targets[converged]).max() < 1e-5
+
+    # trayectoria con arranque en caliente: pocos pasos por punto
+    path = examen.origins(np.linspace([0, 20, 20], [60, 40, 30], 50))[:, -1, :2]
+    q, iterations, residual, converged = ik_dls_trajectory(examen, path, q0=[0, 20, 20],
+                                                           rows=(0, 1))
+    assert converged.all() and iterations[1:].max() < 20
+    # sin saltos de rama entre puntos vecinos
+    assert np.abs(np.diff(q, axis=0)).max() < 5
+
+    # velocidad: la semilla por lotes debe ganarle al punto por punto
+    # (stride=1) y a resolver cada punto en frío
+    from time import perf_counter
+    path = examen.origins(np.linspace([0, 20, 20], [60, 40, 30], 200))[:, -1, :2]
+
+    def best_of(f, repeat=3):
+        times = []
+        for _ in range(repeat):
+            t0 = perf_counter()
+            f()
+            times.append(perf_counter() - t0)
+        return min(times)
+
+    t_batch = best_of(lambda: ik_dls_trajectory(examen, path, q0=[0, 20, 20], rows=(0, 1)))
+    t_point = best_of(lambda: ik_dls_trajectory(examen, path, q0=[0, 20, 20], rows=(0, 1),
+                                                stride=1))
+    t_cold = best_of(lambda: [ik_dls(examen, p, rows=(0, 1)) for p in path])
+    assert t_batch < t_point and t_batch < t_cold, \
+        f"trayectoria {t_batch:.3f} s, punto por punto {t_point:.3f} s, en frío {t_cold:.3f} s"
+    print("cadena_dh.py: ok")
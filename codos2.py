@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from brazo2r import compute_trajectory
+from instrumentacion import FrameTimer
 
 # ------------------ CINEMÁTICA INVERSA YZ ------------------
 
@@ -40,25 +42,10 @@ def fk_2r_yz(L1, L2, th1_deg, th2_deg):
 
 # ------------------ ANIMACIÓN ------------------
 
-def animate_arm_yz(L1, L2, y_target, z_target, elbow='up', steps=100):
-    ik_result = ik_2r_yz(L1, L2, y_target, z_target, elbow)
-    if ik_result is None:
-        print("Objetivo fuera del alcance")
-        return
-    th1_end, th2_end = ik_result
-
-    y_traj = np.linspace(L1+L2, y_target, steps)
-    z_traj = np.linspace(0, z_target, steps)
-
-    theta1_vals = []
-    theta2_vals = []
-    for y, z in zip(y_traj, z_traj):
-        res = ik_2r_yz(L1, L2, y, z, elbow)
-        if res is None:
-            print(f"Punto ({y:.2f},{z:.2f}) fuera del alcance")
-            return
-        theta1_vals.append(res[0])
-        theta2_vals.append(res[1])
+def play_arm_yz(traj, interval=30):
+    # Etapa de reproducción: solo actualiza los artistas con la
+    # trayectoria ya calculada por compute_trajectory
+    L1, L2 = traj.L1, traj.L2
 
     fig = plt.figure(figsize=(6,6))
     ax = fig.add_subplot(111, projection='3d')
@@ -68,16 +55,36 @@ def animate_arm_yz(L1, L2, y_target, z_target, elbow='up', steps=100):
     ax.set_xlabel('X'); ax.set_ylabel('Y'); ax.set_zlabel('Z')
 
     line, = ax.plot([], [], [], 'o-', lw=3, markersize=8, color='blue')
-    target_dot = ax.scatter([0], [y_target], [z_target], marker='x', s=100, c='red')
+    target_dot = ax.scatter(*[[c] for c in traj.target], marker='x', s=100, c='red')
 
     def update(i):
-        xs, ys, zs = fk_2r_yz(L1, L2, theta1_vals[i], theta2_vals[i])
+        xs, ys, zs = traj.joints[i].T
         line.set_data(xs, ys)
         line.set_3d_properties(zs)
         return line,
 
-    anim = FuncAnimation(fig, update, frames=steps, interval=30, blit=False)
+    # tiempos por cuadro (solo con ROBOTICA_TIMING=1)
+    timer = FrameTimer.from_env(interval=interval/1000, name="play_arm_yz")
+
+    anim = FuncAnimation(fig, timer.wrap(update), frames=len(traj), interval=interval, blit=False)
     plt.show()
+    timer.finish()
+
+
+def animate_arm_yz(L1, L2, y_target, z_target, elbow='up', steps=100, tol=None):
+    ik_result = ik_2r_yz(L1, L2, y_target, z_target, elbow)
+    if ik_result is None:
+        print("Objetivo fuera del alcance")
+        return
+
+    traj = compute_trajectory(L1, L2, y_target, z_target, elbow, steps, plane='yz', tol=tol)
+    i = traj.first_unreachable()
+    if i is not None:
+        y, z = traj.path[i, 1:]
+        print(f"Punto ({y:.2f},{z:.2f}) fuera del alcance")
+        return
+
+    play_arm_yz(traj)
 
 # ------------------ LOOP INTERACTIVO ------------------
 
@@ -0,0 +1,143 @@
+import numpy as np
+from perfiles import time_scaling
+
+# ------------------ Cuaterniones unitarios ------------------
+# Núcleo de orientación con cuaterniones [w, x, y, z] (w = parte escalar).
+# Todas las funciones aceptan un cuaternión (4,) o un lote (..., 4), de modo
+# que interpolar la orientación de N cuadros es una sola llamada.
+# Los ángulos van en grados, igual que RotX/RotY/RotZ.
+
+
+def normalize(q):
+    q = np.asarray(q, dtype=float)
+    return q / np.linalg.norm(q, axis=-1, keepdims=True)
+
+
+def from_axis_angle(axis, angle_deg):
+    # Cuaternión de un giro de angle_deg alrededor de axis (..., 3)
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis, axis=-1, keepdims=True)
+    half = np.deg2rad(np.asarray(angle_deg, dtype=float)) / 2
+    return np.concatenate([np.cos(half)[..., None],
+                           np.sin(half)[..., None] * axis], axis=-1)
+
+
+def qx(t):
+    # Equivalente de RotX(t); t escalar o arreglo -> (..., 4)
+    return from_axis_angle([1, 0, 0], t)
+
+
+def qy(t):
+    # Equivalente de RotY(t)
+    return from_axis_angle([0, 1, 0], t)
+
+
+def qz(t):
+    # Equivalente de RotZ(t)
+    return from_axis_angle([0, 0, 1], t)
+
+
+def multiply(a, b):
+    # Producto de Hamilton a·b: aplicar b y luego a, como RotA @ RotB
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack([aw*bw - ax*bx - ay*by - az*bz,
+                     aw*bx + ax*bw + ay*bz - az*by,
+                     aw*by - ax*bz + ay*bw + az*bx,
+                     aw*bz + ax*by - ay*bx + az*bw], axis=-1)
+
+
+def conjugate(q):
+    q = np.asarray(q, dtype=float)
+    return q * np.array([1, -1, -1, -1])
+
+
+def to_matrix(q):
+    # Cuaternión(es) (..., 4) -> matriz(ces) de rotación (..., 3, 3)
+    w, x, y, z = np.moveaxis(normalize(q), -1, 0)
+    R = np.empty(w.shape + (3, 3))
+    R[..., 0, 0] = 1 - 2*(y*y + z*z)
+    R[..., 0, 1] = 2*(x*y - w*z)
+    R[..., 0, 2] = 2*(x*z + w*y)
+    R[..., 1, 0] = 2*(x*y + w*z)
+    R[..., 1, 1] = 1 - 2*(x*x + z*z)
+    R[..., 1, 2] = 2*(y*z - w*x)
+    R[..., 2, 0] = 2*(x*z - w*y)
+    R[..., 2, 1] = 2*(y*z + w*x)
+    R[..., 2, 2] = 1 - 2*(x*x + y*y)
+    return R
+
+
+def from_matrix(R):
+    # Matriz(ces) de rotación (..., 3, 3) -> cuaternión(es) (..., 4) con
+    # w >= 0 (método de Shepperd: se elige el pivote más estable)
+    R = np.asarray(R, dtype=float)
+    m00, m11, m22 = R[..., 0, 0], R[..., 1, 1], R[..., 2, 2]
+    trace = m00 + m11 + m22
+    cand = np.stack([trace, m00, m11, m22], axis=-1)
+    k = np.argmax(cand, axis=-1)
+
+    q = np.empty(R.shape[:-2] + (4,))
+    r = np.sqrt(np.maximum(1 + 2*np.take_along_axis(cand, k[..., None], -1)[..., 0] - trace, 0))
+    s = 0.5 / np.where(r == 0, 1, r)
+    d21, d02, d10 = R[..., 2, 1] - R[..., 1, 2], R[..., 0, 2] - R[..., 2, 0], R[..., 1, 0] - R[..., 0, 1]
+    s21, s02, s10 = R[..., 2, 1] + R[..., 1, 2], R[..., 0, 2] + R[..., 2, 0], R[..., 1, 0] + R[..., 0, 1]
+    options = [np.stack([r/2, d21*s, d02*s, d10*s], axis=-1),
+               np.stack([d21*s, r/2, s10*s, s02*s], axis=-1),
+               np.stack([d02*s, s10*s, r/2, s21*s], axis=-1),
+               np.stack([d10*s, s02*s, s21*s, r/2], axis=-1)]
+    for i, opt in enumerate(options):
+        sel = k == i
+        q[sel] = opt[sel]
+    return normalize(np.where(q[..., :1] < 0, -q, q))
+
+
+def rotate(q, points):
+    # Rota puntos (P, 3) con el/los cuaternión(es) q; con q (N, 4) regresa
+    # (N, P, 3): todos los cuadros de una vez
+    return np.einsum('...ij,pj->...pi', to_matrix(q), np.asarray(points, dtype=float))
+
+
+def slerp(q0, q1, t):
+    # Interpolación esférica entre q0 y q1 para los parámetros t en [0, 1]
+    # ----------------------------------------------------------------------
+    # Arguments
+    # q0, q1 -> cuaterniones (4,) o lotes (..., 4) que se difunden
+    # t      -> escalar o arreglo (N,); se agrega como último eje de lote
+    # Returns
+    # (..., N, 4) o (..., 4) si t es escalar
+    # ----------------------------------------------------------------------
+    q0 = normalize(q0)
+    q1 = normalize(q1)
+    t = np.asarray(t, dtype=float)
+    if t.ndim:
+        q0, q1 = q0[..., None, :], q1[..., None, :]
+
+    dot = np.sum(q0*q1, axis=-1)
+    # camino corto: q y -q son la misma rotación
+    q1 = np.where(dot[..., None] < 0, -q1, q1)
+    dot = np.abs(dot)
+
+    theta = np.arccos(np.clip(dot, -1, 1))
+    sin_theta = np.sin(theta)
+    near = sin_theta < 1e-6
+    safe = np.where(near, 1, sin_theta)
+    w0 = np.where(near, 1 - t, np.sin((1 - t)*theta) / safe)
+    w1 = np.where(near, t, np.sin(t*theta) / safe)
+    return normalize(w0[..., None]*q0 + w1[..., None]*q1)
+
+
+def slerp_keyframes(keys, frames_per_segment, kind=None):
+    # Orientaciones de una animación que pasa por varias orientaciones
+    # clave (K, 4): regresa ((K-1)*frames_per_segment + 1, 4) en una llamada.
+    # Con kind ('cubic', 'quintic', 'trapezoidal') el parámetro de cada
+    # segmento sigue ese perfil de perfiles.py y el giro arranca y termina
+    # en reposo en cada orientación clave, sin tirones entre segmentos
+    keys = normalize(keys)
+    t = np.arange(frames_per_segment) / frames_per_segment
+    if kind is not None:
+        t = time_scaling(kind, t, 1.0)[0]
+    q = slerp(keys[:-1], keys[1:], t).reshape(-1, 4)
+    return np.concatenate([q, keys[-1:]], axis=0)
@@ -0,0 +1,186 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+from malla import BOX_EDGES
+
+# ------------------ Dibujo con artistas persistentes ------------------
+# Los scripts originales llaman ax.cla() en cada cuadro y vuelven a crear
+# todos los plot3D. Las clases de este módulo crean los artistas una sola
+# vez y en cada cuadro solo cambian sus datos (set_data/set_3d_properties).
+
+
+def fix_system(ax, axis_length, linewidth=5, colors=("red", "green", "blue")):
+    # Igual que fix_system de los scripts pero sobre un ax explícito;
+    # regresa las tres líneas para poder tratarlas como fondo estático
+    x = [-axis_length, axis_length]
+    zp = [0, 0]
+    return [ax.plot3D(x, zp, zp, color=colors[0], linewidth=linewidth)[0],
+            ax.plot3D(zp, x, zp, color=colors[1], linewidth=linewidth)[0],
+            ax.plot3D(zp, zp, x, color=colors[2], linewidth=linewidth)[0]]
+
+
+def set_segment(line, p_init, p_fin):
+    # Mueve una línea 3D existente al segmento p_init -> p_fin
+    line.set_data([p_init[0], p_fin[0]], [p_init[1], p_fin[1]])
+    line.set_3d_properties([p_init[2], p_fin[2]])
+
+
+class ChainRenderer:
+    # Dibuja una cadena serial (como la de EXAMEN.py) a partir de una pila
+    # de transformaciones (n_frames,4,4): un marco móvil por transformación
+    # y un brazo por cada par de índices en links.
+    # ----------------------------------------------------------------------
+    # Arguments
+    # ax          -> ejes 3D donde dibujar
+    # n_frames    -> número de marcos móviles de la cadena
+    # links       -> pares (i, j) de marcos unidos por un brazo
+    # axis_length -> longitud de los ejes fijos
+    # blit        -> si es True se guarda el fondo estático y en cada cuadro
+    #                solo se redibujan los artistas móviles
+    # ----------------------------------------------------------------------
+    def __init__(self, ax, n_frames, links, axis_length=10, limits=(-20, 20),
+                 frame_scale=1, link_width=4, blit=False):
+        self.ax = ax
+        self.fig = ax.figure
+        self.links = links
+        self.frame_scale = frame_scale
+        self.blit = blit
+
+        ax.set_xlim3d(*limits)
+        ax.set_ylim3d(*limits)
+        ax.set_zlim3d(*limits)
+        ax.view_init(elev=30, azim=40)
+        fix_system(ax, axis_length, linewidth=1)
+
+        self.frame_lines = [[ax.plot3D([], [], [], color=c, linewidth=1)[0]
+                             for c in ("red", "green", "blue")]
+                            for _ in range(n_frames)]
+        self.link_lines = [ax.plot3D([], [], [], color="black", linewidth=link_width)[0]
+                           for _ in links]
+        self.artists = [l for f in self.frame_lines for l in f] + self.link_lines
+
+        self._background = None
+        if blit:
+            for a in self.artists:
+                a.set_animated(True)
+            self._cid = self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+            self.fig.canvas.draw()
+
+    def _on_draw(self, event):
+        # Se vuelve a capturar el fondo cada vez que la figura se redibuja
+        # completa (por ejemplo al cambiar el tamaño de la ventana)
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for a in self.artists:
+            self.fig.draw_artist(a)
+
+    def update(self, T):
+        # Actualiza los artistas con una pila (n_frames,4,4)
+        s = self.frame_scale
+        for lines, Tk in zip(self.frame_lines, T):
+            o = Tk[:3, 3]
+            for k, line in enumerate(lines):
+                set_segment(line, o, o + s*Tk[:3, k])
+        for line, (i, j) in zip(self.link_lines, self.links):
+            set_segment(line, T[i][:3, 3], T[j][:3, 3])
+        return self.artists
+
+    def draw(self):
+        if not self.blit:
+            self.fig.canvas.draw_idle()
+            return
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            self._draw_animated()
+            canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def pause(self, interval):
+        # Con blit no se usa plt.pause porque forzaría un redibujado completo.
+        # start_event_loop trata un tiempo <= 0 como infinito, así que en ese
+        # caso solo se atienden los eventos pendientes, igual que plt.pause(0)
+        if self.blit:
+            if interval > 0:
+                self.fig.canvas.start_event_loop(interval)
+            else:
+                self.fig.canvas.flush_events()
+        else:
+            plt.pause(interval)
+
+
+# ------------------ Cajas ------------------
+# BOX_EDGES (malla.py) son las aristas en el mismo orden que drawBox
+# (p1..p8 -> índices 0..7); cualquier RigidMesh se dibuja pasando
+# edges=mesh.edges.
+
+class BoxRenderer:
+    # Dibuja una caja con dos artistas: las 12 aristas en un solo
+    # Line3DCollection y los 8 vértices en un solo scatter. En cada cuadro
+    # update() mueve ambos en sitio a partir de un arreglo (8,3).
+    # ----------------------------------------------------------------------
+    # Arguments
+    # ax       -> ejes 3D donde dibujar
+    # vertices -> arreglo (8,3) o lista de 8 puntos, orden p1..p8
+    # color        -> color de las aristas
+    # marker_color -> color de los vértices; None toma un color del ciclo
+    #                 por vértice, como los drawScatter sin color
+    # edges        -> pares de índices (E,2) que forman las aristas
+    # ----------------------------------------------------------------------
+    def __init__(self, ax, vertices, color='black', marker='o',
+                 marker_color=None, linewidth=1, edges=BOX_EDGES):
+        self.ax = ax
+        self.edges = np.asarray(edges)
+        V = self._as_array(vertices)
+        self.lines = Line3DCollection(V[self.edges], colors=color, linewidths=linewidth)
+        ax.add_collection3d(self.lines)
+        if marker_color is None:
+            cycle = plt.rcParams['axes.prop_cycle'].by_key()['color']
+            marker_color = [cycle[k % len(cycle)] for k in range(len(V))]
+        self.points = ax.scatter(V[:, 0], V[:, 1], V[:, 2], marker=marker, color=marker_color)
+        self.artists = [self.lines, self.points]
+
+    @staticmethod
+    def _as_array(vertices):
+        return np.asarray(vertices, dtype=float).reshape(-1, 3)
+
+    def update(self, vertices):
+        V = self._as_array(vertices)
+        self.lines.set_segments(V[self.edges])
+        self.points._offsets3d = (V[:, 0], V[:, 1], V[:, 2])
+        return self.artists
+
+
+class BatchRenderer:
+    # Dibuja todas las aristas de un MeshBatch (malla.py) como un solo
+    # artista: una línea 3D cuyos tramos están separados por NaN. Con miles
+    # de cajas esto es ~5x más rápido que una Line3DCollection, que crea un
+    # Path por segmento en cada proyección; update() solo copia los
+    # segmentos al búfer de la línea.
+    # ----------------------------------------------------------------------
+    # Arguments
+    # ax    -> ejes 3D donde dibujar
+    # batch -> MeshBatch con las poses ya aplicadas
+    # color -> color de todas las aristas
+    # ----------------------------------------------------------------------
+    def __init__(self, ax, batch, color='black', linewidth=0.5):
+        self.ax = ax
+        self.batch = batch
+        # (K*E, 3, 3): inicio, fin y un punto NaN que corta la línea
+        self._buffer = np.full(batch.segments().shape[:1] + (3, 3), np.nan)
+        self._xyz = self._buffer.reshape(-1, 3).T
+        self._buffer[:, :2] = batch.segments()
+        self.line = ax.plot3D(*self._xyz, color=color, linewidth=linewidth)[0]
+        self.artists = [self.line]
+
+    def update(self, poses=None):
+        # Aplica las poses (K,4,4), si se dan, y mueve las aristas
+        if poses is not None:
+            self.batch.update(poses)
+        self._buffer[:, :2] = self.batch.segments()
+        self.line.set_data_3d(*self._xyz)
+        return self.artists
@@ -0,0 +1,137 @@
+import numpy as np
+
+# ------------------ Grafo de escena ------------------
+# Árbol de marcos: cada nodo guarda su transformación local (4,4) respecto
+# al padre y una copia en caché de su transformación global. Cambiar la
+# local de un nodo solo marca como sucio su subárbol; las globales se
+# recalculan (un producto 4x4 por nodo) la próxima vez que se leen. Así una
+# herramienta, una caja o un marco extra colgado de un eslabón solo cuesta
+# cuando cambia su propia rama.
+#
+#   scene = SceneGraph()
+#   scene.add_chain(["T1", "T12", "T123"], [TRz(30), TTx(15), TRz(30)])
+#   scene.add("tool", TTx(7), parent="T123")
+#   scene.set_local("tool", TTx(8))     # solo la herramienta queda sucia
+#   scene.world("tool")                 # un producto 4x4; la cadena sigue en caché
+#
+# Si todas las articulaciones cambian en cada cuadro (EXAMEN.py) el grafo no
+# ahorra nada: ahí conviene precalcular la pila con compose_chain.
+
+
+class SceneNode:
+    # Nodo del grafo
+    # ----------------------------------------------------------------------
+    # Arguments
+    # name  -> nombre del nodo
+    # local -> transformación (4,4) respecto al padre, identidad por defecto
+    # ----------------------------------------------------------------------
+    def __init__(self, name, local=None):
+        self.name = name
+        self.parent = None
+        self.children = []
+        self._local = np.eye(4) if local is None else np.array(local, dtype=float)
+        self._world = np.empty((4, 4))
+        self._dirty = True
+
+    @property
+    def local(self):
+        return self._local
+
+    @local.setter
+    def local(self, T):
+        self._local[...] = T
+        self.invalidate()
+
+    @property
+    def dirty(self):
+        return self._dirty
+
+    @property
+    def world(self):
+        # Transformación global; si está sucia se juntan los ancestros sucios
+        # (un nodo limpio tiene todos sus ancestros limpios) y se recalculan
+        # de arriba hacia abajo, sin recursión para cadenas profundas
+        if self._dirty:
+            pending = []
+            node = self
+            while node is not None and node._dirty:
+                pending.append(node)
+                node = node.parent
+            for node in reversed(pending):
+                if node.parent is None:
+                    node._world[...] = node._local
+                else:
+                    np.matmul(node.parent._world, node._local, out=node._world)
+                node._dirty = False
+        return self._world
+
+    def invalidate(self):
+        # Marca este nodo y su subárbol como sucios. Un nodo sucio ya tiene
+        # todo su subárbol sucio, así que ahí se corta el recorrido
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node._dirty and node is not self:
+                continue
+            node._dirty = True
+            stack.extend(node.children)
+
+    def attach(self, child):
+        # Cuelga child (y su subárbol) de este nodo
+        if child.parent is not None:
+            child.parent.children.remove(child)
+        child.parent = self
+        self.children.append(child)
+        child.invalidate()
+        return child
+
+    def walk(self):
+        # Recorre el subárbol en preorden
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+
+class SceneGraph:
+    # Grafo con acceso por nombre; la raíz se llama "root"
+    def __init__(self, base=None):
+        self.root = SceneNode("root", base)
+        self.nodes = {"root": self.root}
+
+    def __getitem__(self, name):
+        return self.nodes[name]
+
+    def __contains__(self, name):
+        return name in self.nodes
+
+    def add(self, name, local=None, parent="root"):
+        if name in self.nodes:
+            raise ValueError(f"ya existe un nodo llamado {name!r}")
+        parent = self.nodes[parent]
+        node = SceneNode(name, local)
+        self.nodes[name] = node
+        return parent.attach(node)
+
+    def add_chain(self, names, locals_, parent="root"):
+        # Agrega una cadena serial: cada nodo cuelga del anterior
+        for name, local in zip(names, locals_):
+            self.add(name, local, parent)
+            parent = name
+        return self.nodes[parent]
+
+    def set_local(self, name, T):
+        self.nodes[name].local = T
+
+    def world(self, name):
+        return self.nodes[name].world
+
+    def worlds(self, names, out=None):
+        # Pila (n,4,4) con las globales de los nodos pedidos, p. ej. para
+        # ChainRenderer.update
+        if out is None:
+            out = np.empty((len(names), 4, 4))
+        for k, name in enumerate(names):
+            out[k] = self.nodes[name].world
+        return out
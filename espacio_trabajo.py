@@ -0,0 +1,123 @@
+import numpy as np
+
+# ------------------ Espacio de trabajo ------------------
+# Mapa de alcanzabilidad en una rejilla 2-D o 3-D. Se muestrea el espacio
+# articular (respetando límites), se calcula la posición del efector con
+# cinemática directa vectorizada y cada celda visitada se marca en un
+# arreglo de bits, uno por rama del codo (theta2 >= 0 -> 'up',
+# theta2 < 0 -> 'down', igual que en ik_2r). Preguntar si un punto es
+# alcanzable cuesta un índice y una operación de bits.
+
+BRANCHES = ('up', 'down')
+
+
+class WorkspaceMap:
+    # Rejilla de ocupación empaquetada en bits
+    # ----------------------------------------------------------------------
+    # Arguments
+    # lo, hi -> esquinas de la caja que cubre la rejilla, (dim,)
+    # cell   -> tamaño de celda (escalar o uno por dimensión)
+    # ----------------------------------------------------------------------
+    def __init__(self, lo, hi, cell):
+        self.lo = np.asarray(lo, dtype=float)
+        self.hi = np.asarray(hi, dtype=float)
+        self.cell = np.broadcast_to(np.asarray(cell, dtype=float), self.lo.shape).copy()
+        self.shape = tuple(int(n) for n in np.maximum(np.ceil((self.hi - self.lo) / self.cell), 1))
+        self.n_cells = int(np.prod(self.shape))
+        self.bits = np.zeros((len(BRANCHES), (self.n_cells + 7) // 8), dtype=np.uint8)
+        self.samples = 0
+
+    @property
+    def dim(self):
+        return len(self.shape)
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    def cell_index(self, points):
+        # Índice plano de la celda de cada punto y máscara de puntos dentro
+        # de la rejilla
+        points = np.asarray(points, dtype=float).reshape(-1, self.dim)
+        ijk = np.floor((points - self.lo) / self.cell).astype(np.int64)
+        inside = np.all((ijk >= 0) & (ijk < self.shape), axis=1)
+        ijk = np.where(inside[:, None], ijk, 0)
+        return np.ravel_multi_index(ijk.T, self.shape), inside
+
+    def add(self, points, branch):
+        # Marca las celdas de los puntos; branch es un arreglo booleano
+        # (True = 'down') o el nombre de una rama para todos los puntos
+        idx, inside = self.cell_index(points)
+        if isinstance(branch, str):
+            branch = np.full(len(idx), BRANCHES.index(branch) == 1)
+        branch = np.asarray(branch, dtype=bool)
+        for b in range(len(BRANCHES)):
+            sel = inside & (branch == bool(b))
+            if not sel.any():
+                continue
+            # solo las celdas tocadas; no se desempaqueta toda la rejilla
+            u = np.unique(idx[sel])
+            np.bitwise_or.at(self.bits[b], u >> 3, (1 << (u & 7)).astype(np.uint8))
+        self.samples += len(idx)
+
+    def branches(self, points):
+        # (N, 2) booleano: alcanzable con codo 'up' / 'down'
+        idx, inside = self.cell_index(points)
+        bit = (self.bits[:, idx >> 3] >> (idx & 7).astype(np.uint8)) & 1
+        return (bit.T.astype(bool)) & inside[:, None]
+
+    def reachable(self, points):
+        return self.branches(points).any(axis=1)
+
+    def occupancy(self, branch=None):
+        # Rejilla booleana desempaquetada con la forma self.shape
+        if branch is None:
+            packed = self.bits[0] | self.bits[1]
+        else:
+            packed = self.bits[BRANCHES.index(branch)]
+        occ = np.unpackbits(packed, count=self.n_cells, bitorder='little')
+        return occ.astype(bool).reshape(self.shape)
+
+
+def _sample_joints(rng, limits, n):
+    limits = np.asarray(limits, dtype=float)
+    return rng.uniform(limits[:, 0], limits[:, 1], (n, len(limits)))
+
+
+def map_2r(L1, L2, cell, theta1_limits=(-180, 180), theta2_limits=(-180, 180),
+           samples=1_000_000, chunk=1 << 20, seed=0):
+    # Mapa 2-D del brazo 2R de Codos.py muestreando (theta1, theta2)
+    # uniformemente dentro de los límites (en grados)
+    R = L1 + L2
+    wm = WorkspaceMap([-R, -R], [R, R], cell)
+    rng = np.random.default_rng(seed)
+    limits = [theta1_limits, theta2_limits]
+    for start in range(0, samples, chunk):
+        q = np.radians(_sample_joints(rng, limits, min(chunk, samples - start)))
+        t12 = q[:, 0] + q[:, 1]
+        tip = np.stack([L1*np.cos(q[:, 0]) + L2*np.cos(t12),
+                        L1*np.sin(q[:, 0]) + L2*np.sin(t12)], axis=1)
+        wm.add(tip, q[:, 1] < 0)
+    return wm
+
+
+def map_scara(robot, cell, theta2_limits=(-150, 150), piston_limits=(418.5, 880),
+              theta1_limits=None, samples=1_000_000, chunk=1 << 20, seed=0):
+    # Mapa 3-D del SCARARobotAlt de EXAMENFINAL.py. Por defecto theta1 queda
+    # fijo en el valor del robot; con theta1_limits también se muestrea
+    R = robot.L1 + robot.L2
+    wm = WorkspaceMap([-R, -R, piston_limits[0]], [R, R, piston_limits[1]], cell)
+    rng = np.random.default_rng(seed)
+    th1 = np.rad2deg(robot.theta1)
+    if theta1_limits is None:
+        theta1_limits = (th1, th1)
+    limits = [theta1_limits, theta2_limits, piston_limits]
+    for start in range(0, samples, chunk):
+        q = _sample_joints(rng, limits, min(chunk, samples - start))
+        t1 = np.radians(q[:, 0])
+        t12 = t1 + np.radians(q[:, 1])
+        tip = np.stack([robot.L1*np.cos(t1) + robot.L2*np.cos(t12),
+                        robot.L1*np.sin(t1) + robot.L2*np.sin(t12),
+                        q[:, 2]], axis=1)
+        wm.add(tip, q[:, 1] < 0)
+    return wm
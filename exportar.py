@@ -0,0 +1,130 @@
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+# ------------------ Render sin pantalla ------------------
+# Convierte una trayectoria ya calculada en una secuencia de PNG numerados
+# (y opcionalmente un GIF) con el backend Agg. Los cuadros se reparten en
+# rangos contiguos entre procesos: cada proceso construye su propia escena
+# una vez y solo llama update(i) + savefig para cada cuadro de su rango.
+#
+# Una escena es cualquier objeto que se pueda mandar a otro proceso (una
+# clase o función de módulo) y que al llamarse regrese (fig, update).
+#
+#   python exportar.py scara salida/ --gif scara.gif --workers 8
+
+
+def _use_agg():
+    plt.switch_backend("agg")
+
+
+def _render_range(make_scene, start, stop, out_dir, pattern, dpi):
+    fig, update = make_scene()
+    paths = []
+    for i in range(start, stop):
+        update(i)
+        path = os.path.join(out_dir, pattern.format(i))
+        fig.savefig(path, dpi=dpi)
+        paths.append(path)
+    plt.close(fig)
+    return paths
+
+
+def render_frames(make_scene, n_frames, out_dir, workers=None,
+                  pattern="frame_{:05d}.png", dpi=100):
+    # Renderiza los cuadros 0..n_frames-1 como PNG en out_dir
+    # ----------------------------------------------------------------------
+    # Arguments
+    # make_scene -> callable sin argumentos que regresa (fig, update)
+    # n_frames   -> número de cuadros de la trayectoria
+    # workers    -> procesos a usar (por defecto, uno por núcleo)
+    # Returns
+    # lista ordenada con las rutas de los PNG escritos
+    # ----------------------------------------------------------------------
+    os.makedirs(out_dir, exist_ok=True)
+    workers = max(1, min(workers or os.cpu_count() or 1, n_frames))
+    bounds = np.linspace(0, n_frames, workers + 1).astype(int)
+
+    if workers == 1:
+        return _render_range(make_scene, 0, n_frames, out_dir, pattern, dpi)
+
+    with ProcessPoolExecutor(workers, initializer=_use_agg) as pool:
+        futures = [pool.submit(_render_range, make_scene, a, b, out_dir, pattern, dpi)
+                   for a, b in zip(bounds[:-1], bounds[1:])]
+        return [p for f in futures for p in f.result()]
+
+
+def save_gif(paths, out_path, fps=25):
+    # Une los PNG en un GIF animado (Pillow viene con matplotlib)
+    from PIL import Image
+    frames = [Image.open(p) for p in paths]
+    frames[0].save(out_path, save_all=True, append_images=frames[1:],
+                   duration=int(1000 / fps), loop=0)
+
+
+# ------------------ Escenas ------------------
+
+class SCARAScene:
+    # Escena del SCARA de EXAMENFINAL.py con sus secuencias ya calculadas
+    def __init__(self, theta2_seq, piston_seq, theta3_seq, theta1_deg=30, L1=715, L2=850):
+        self.theta2_seq = theta2_seq
+        self.piston_seq = piston_seq
+        self.theta3_seq = theta3_seq
+        self.theta1_deg = theta1_deg
+        self.L1 = L1
+        self.L2 = L2
+
+    def __len__(self):
+        return len(self.theta2_seq)
+
+    def __call__(self):
+        from EXAMENFINAL import SCARARobotAlt, SCARASimulatorAlt
+        robot = SCARARobotAlt(theta1_deg=self.theta1_deg, L1=self.L1, L2=self.L2)
+        sim = SCARASimulatorAlt(robot, self.theta2_seq, self.piston_seq, self.theta3_seq)
+        return sim.fig, sim.update
+
+
+class ChainScene:
+    # Escena de una cadena serial precalculada (N, n_frames, 4, 4), por
+    # ejemplo la salida de transformaciones.compose_chain
+    def __init__(self, chain, links, limits=(-20, 20)):
+        self.chain = chain
+        self.links = links
+        self.limits = limits
+
+    def __len__(self):
+        return len(self.chain)
+
+    def __call__(self):
+        from dibujo import ChainRenderer
+        fig = plt.figure()
+        ax = fig.add_subplot(111, projection="3d")
+        renderer = ChainRenderer(ax, self.chain.shape[1], self.links, limits=self.limits)
+        return fig, lambda i: renderer.update(self.chain[i])
+
+
+# ------------------ Main ------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exporta animaciones sin pantalla")
+    parser.add_argument("escena", choices=["scara"])
+    parser.add_argument("salida", help="carpeta para los PNG")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--gif", default=None, help="ruta del GIF opcional")
+    parser.add_argument("--fps", type=int, default=25)
+    args = parser.parse_args()
+
+    # solo la línea de comandos cambia el backend del proceso principal; al
+    # importar el módulo desde una sesión interactiva se respeta el suyo
+    _use_agg()
+    from EXAMENFINAL import secuencia_examen
+    scene = SCARAScene(*secuencia_examen())
+
+    paths = render_frames(scene, len(scene), args.salida, args.workers, dpi=args.dpi)
+    print(f"{len(paths)} cuadros en {args.salida}")
+    if args.gif:
+        save_gif(paths, args.gif, args.fps)
+        print(f"GIF: {args.gif}")
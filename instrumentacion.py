@@ -0,0 +1,162 @@
+import os
+import json
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+# ------------------ Tiempos por cuadro ------------------
+# Instrumentación opcional para los lazos de animación. Cada cuadro se
+# divide en fases (kinematics, artists, draw, pause) y al final se imprime
+# un resumen (p50/p95/max y fps logrados contra el intervalo pedido) o se
+# escribe un archivo de traza para chrome://tracing o Perfetto.
+#
+# Los scripts la activan con variables de entorno:
+#
+#   ROBOTICA_TIMING=1 python EXAMEN.py
+#   ROBOTICA_TIMING=1 ROBOTICA_TRACE=traza.json python Codos.py
+#
+# Sin ROBOTICA_TIMING el temporizador queda desactivado y frame()/phase()
+# no miden nada.
+
+
+def _stats(values):
+    # p50, p95 y máximo en milisegundos
+    v = np.asarray(values) * 1e3
+    if v.size == 0:
+        return {"p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {"p50": float(np.percentile(v, 50)),
+            "p95": float(np.percentile(v, 95)),
+            "max": float(v.max())}
+
+
+class FrameTimer:
+    # Registra la duración de cada cuadro y de sus fases
+    # ----------------------------------------------------------------------
+    # Arguments
+    # interval -> intervalo pedido entre cuadros en segundos (el de
+    #             plt.pause o FuncAnimation), para comparar los fps
+    # enabled  -> si es False no se mide nada
+    # trace    -> ruta opcional para escribir la traza al llamar finish()
+    # name     -> nombre de la animación en el resumen y la traza
+    # ----------------------------------------------------------------------
+    def __init__(self, interval=None, enabled=True, trace=None, name="animacion"):
+        self.interval = interval
+        self.enabled = enabled
+        self.trace = trace
+        self.name = name
+        self.frames = []
+        self._current = None
+
+    @classmethod
+    def from_env(cls, interval=None, name="animacion"):
+        enabled = bool(os.environ.get("ROBOTICA_TIMING"))
+        return cls(interval, enabled, os.environ.get("ROBOTICA_TRACE"), name)
+
+    @contextmanager
+    def frame(self):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        self._current = {"start": start, "total": 0.0, "phases": []}
+        try:
+            yield
+        finally:
+            self._current["total"] = time.perf_counter() - start
+            self.frames.append(self._current)
+            self._current = None
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled or self._current is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current["phases"].append((name, start, time.perf_counter() - start))
+
+    def wrap(self, update, phase="artists"):
+        # Envuelve el callback de FuncAnimation. El tiempo dentro del
+        # callback cuenta como `phase`; el tiempo entre el final de un
+        # callback y el inicio del siguiente es el dibujo más el lazo de
+        # eventos de matplotlib y se guarda como "draw+pause"
+        if not self.enabled:
+            return update
+        last_end = [None]
+
+        def wrapped(*args, **kwargs):
+            start = time.perf_counter()
+            if last_end[0] is not None and self.frames:
+                prev = self.frames[-1]
+                gap = start - last_end[0]
+                prev["phases"].append(("draw+pause", last_end[0], gap))
+                prev["total"] += gap
+            result = update(*args, **kwargs)
+            end = time.perf_counter()
+            self.frames.append({"start": start, "total": end - start,
+                                "phases": [(phase, start, end - start)]})
+            last_end[0] = end
+            return result
+        return wrapped
+
+    def summary(self):
+        frames = self.frames
+        phases = {}
+        for f in frames:
+            for name, _, dur in f["phases"]:
+                phases.setdefault(name, []).append(dur)
+        starts = np.array([f["start"] for f in frames])
+        periods = np.diff(starts)
+
+        out = {"name": self.name,
+               "frames": len(frames),
+               "frame": _stats([f["total"] for f in frames]),
+               "phases": {name: _stats(d) for name, d in phases.items()},
+               "fps": float(1/periods.mean()) if periods.size else None}
+        if self.interval:
+            out["requested_fps"] = 1/self.interval
+            out["late_frames"] = int(np.sum(periods > 1.5*self.interval))
+        return out
+
+    def report(self):
+        s = self.summary()
+        print(f"== {s['name']}: {s['frames']} cuadros ==")
+        print(f"{'fase':14s} {'p50 ms':>9s} {'p95 ms':>9s} {'max ms':>9s}")
+        rows = list(s["phases"].items()) + [("cuadro", s["frame"])]
+        for name, st in rows:
+            print(f"{name:14s} {st['p50']:9.2f} {st['p95']:9.2f} {st['max']:9.2f}")
+        if s["fps"] is not None:
+            line = f"fps logrados: {s['fps']:.1f}"
+            if self.interval:
+                line += (f" (pedidos {s['requested_fps']:.1f},"
+                         f" {s['late_frames']} cuadros tarde)")
+            print(line)
+        return s
+
+    def write_trace(self, path):
+        # Formato Trace Event de Chrome: un evento por cuadro y por fase
+        if not self.frames:
+            return
+        t0 = self.frames[0]["start"]
+        events = []
+        for i, f in enumerate(self.frames):
+            events.append({"name": f"cuadro {i}", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": (f["start"] - t0)*1e6, "dur": f["total"]*1e6})
+            for name, start, dur in f["phases"]:
+                events.append({"name": name, "ph": "X", "pid": 0, "tid": 1,
+                               "ts": (start - t0)*1e6, "dur": dur*1e6})
+        with open(path, "w") as fh:
+            json.dump({"traceEvents": events,
+                       "otherData": {"name": self.name}}, fh)
+
+    def finish(self):
+        # Imprime el resumen y escribe la traza si se pidió
+        if not self.enabled or not self.frames:
+            return None
+        s = self.report()
+        if self.trace:
+            self.write_trace(self.trace)
+        return s
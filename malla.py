@@ -0,0 +1,178 @@
+import numpy as np
+
+# ------------------ Mallas rígidas ------------------
+# Un cuerpo rígido como arreglos: vértices (V,3) contiguos, aristas (E,2) y
+# caras (F,k) opcionales como índices a los vértices. Las transformaciones
+# aplican R·p + t a todos los vértices con un solo matmul y escriben en un
+# búfer preasignado (mesh.world), en lugar de transformar p1..p8 uno por uno
+# con .dot(). Sirve para cualquier forma, no solo la caja de 7x2x3.
+#
+#   box = RigidMesh.box()
+#   V = box.transform(RotZ(45), [4, 4, 4])     # (8,3), mismo arreglo siempre
+#   BoxRenderer(ax, V, edges=box.edges)
+
+# caja de los scripts Box3D: vértices en el orden p1..p8
+BOX_VERTICES = np.array([[0, 0, 0], [7, 0, 0], [7, 0, 3], [0, 0, 3],
+                         [0, 2, 0], [7, 2, 0], [7, 2, 3], [0, 2, 3]], dtype=float)
+
+BOX_EDGES = np.array([[0, 1], [1, 2], [2, 3], [3, 0],
+                      [4, 5], [5, 6], [6, 7], [7, 4],
+                      [3, 7], [0, 4], [2, 6], [1, 5]])
+
+BOX_FACES = np.array([[0, 1, 2, 3], [4, 7, 6, 5],
+                      [0, 4, 5, 1], [3, 2, 6, 7],
+                      [0, 3, 7, 4], [1, 5, 6, 2]])
+
+
+class RigidMesh:
+    # Malla rígida con búfer de salida preasignado
+    # ----------------------------------------------------------------------
+    # Arguments
+    # vertices -> (V,3) posiciones en el marco propio del cuerpo
+    # edges    -> (E,2) pares de índices de vértices
+    # faces    -> (F,k) índices de vértices por cara, opcional
+    # ----------------------------------------------------------------------
+    def __init__(self, vertices, edges, faces=None):
+        # copia propia: bake() escribe en estos vértices
+        self.vertices = np.array(vertices, dtype=float, copy=True).reshape(-1, 3)
+        self.edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+        self.faces = None if faces is None else np.asarray(faces, dtype=np.intp)
+        if self.edges.size and self.edges.max() >= len(self.vertices):
+            raise ValueError("las aristas hacen referencia a vértices inexistentes")
+        self.world = self.vertices.copy()
+        self._segments = np.empty((len(self.edges), 2, 3))
+
+    @classmethod
+    def box(cls, size=(7, 2, 3), origin=(0, 0, 0)):
+        # Caja alineada a los ejes con el mismo orden de vértices que
+        # p1_init..p8_init; size=(7,2,3) es la caja de los scripts
+        V = BOX_VERTICES / [7, 2, 3] * np.asarray(size, dtype=float) + origin
+        return cls(V, BOX_EDGES, BOX_FACES)
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def transform(self, R=None, t=None):
+        # world = R·p + t para todos los vértices; regresa self.world
+        if R is None:
+            self.world[...] = self.vertices
+        else:
+            np.matmul(self.vertices, np.asarray(R, dtype=float).T, out=self.world)
+        if t is not None:
+            self.world += t
+        return self.world
+
+    def apply(self, T):
+        # Igual que transform con una matriz homogénea (4,4)
+        T = np.asarray(T, dtype=float)
+        return self.transform(T[:3, :3], T[:3, 3])
+
+    def bake(self):
+        # Toma la posición transformada como nueva forma propia, para
+        # encadenar movimientos (equivale a points = points_rot)
+        self.vertices[...] = self.world
+        return self
+
+    def copy(self):
+        mesh = RigidMesh(self.vertices, self.edges, self.faces)
+        mesh.world[...] = self.world
+        return mesh
+
+    def segments(self):
+        # Aristas de la posición transformada como (E,2,3), listo para
+        # Line3DCollection.set_segments; reutiliza el mismo búfer
+        return np.take(self.world, self.edges, axis=0, out=self._segments)
+
+    def face_vertices(self):
+        # Vértices de cada cara (F,k,3) en la posición transformada
+        if self.faces is None:
+            raise ValueError("la malla no tiene caras")
+        return self.world[self.faces]
+
+
+# ------------------ Lotes de cuerpos rígidos ------------------
+
+class MeshBatch:
+    # K cuerpos con la misma topología (p. ej. K cajas de distintos tamaños)
+    # guardados como un solo arreglo (K,V,3) con una pose (K,4,4) por cuerpo.
+    # update() transforma todos los vértices con un solo matmul y segments()
+    # regresa las K*E aristas listas para una sola Line3DCollection.
+    # ----------------------------------------------------------------------
+    # Arguments
+    # vertices -> (K,V,3) vértices de cada cuerpo en su marco propio
+    # edges    -> (E,2) aristas, las mismas para todos los cuerpos
+    # faces    -> (F,k) caras, opcional
+    # poses    -> (K,4,4) poses iniciales, identidad por defecto
+    # ----------------------------------------------------------------------
+    def __init__(self, vertices, edges, faces=None, poses=None):
+        self.vertices = np.array(vertices, dtype=float, copy=True)
+        if self.vertices.ndim != 3 or self.vertices.shape[-1] != 3:
+            raise ValueError("vertices debe tener forma (K,V,3)")
+        K, V = self.vertices.shape[:2]
+        self.edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+        self.faces = None if faces is None else np.asarray(faces, dtype=np.intp)
+        self.poses = np.tile(np.eye(4), (K, 1, 1))
+        if poses is not None:
+            self.poses[...] = poses
+        self.world = np.empty_like(self.vertices)
+        # índices de las aristas en el arreglo plano (K*V,3) de vértices
+        self._flat_edges = (self.edges[None] + V*np.arange(K)[:, None, None]).reshape(-1, 2)
+        self._segments = np.empty((len(self._flat_edges), 2, 3))
+        self.update()
+
+    @classmethod
+    def boxes(cls, sizes, poses=None):
+        # K cajas con el orden de vértices p1..p8; sizes (K,3) o (3,) con
+        # el tamaño de cada caja y poses (K,4,4) opcionales
+        sizes = np.asarray(sizes, dtype=float)
+        if poses is not None:
+            sizes = np.broadcast_to(sizes, (len(poses), 3))
+        V = BOX_VERTICES / [7, 2, 3] * sizes.reshape(-1, 1, 3)
+        return cls(V, BOX_EDGES, BOX_FACES, poses)
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def update(self, poses=None):
+        # Copia las poses nuevas (K,4,4), si se dan, y recalcula world
+        # (K,V,3) en sitio; regresa self.world
+        if poses is not None:
+            self.poses[...] = poses
+        # un solo producto por lotes (K,V,3)@(K,3,3); equivale a
+        # einsum('kij,kvj->kvi') pero numpy lo resuelve ~10x más rápido
+        np.matmul(self.vertices, np.swapaxes(self.poses[:, :3, :3], 1, 2),
+                  out=self.world)
+        self.world += self.poses[:, None, :3, 3]
+        return self.world
+
+    def segments(self):
+        # (K*E,2,3) aristas de todos los cuerpos en un mismo búfer
+        return np.take(self.world.reshape(-1, 3), self._flat_edges, axis=0,
+                       out=self._segments)
+
+
+# ------------------ Verificación ------------------
+
+if __name__ == "__main__":
+    # python malla.py: comprobaciones rápidas de copia y transformación
+    from rotaciones import RotX
+
+    src = BOX_VERTICES.copy()
+    box = RigidMesh(src, BOX_EDGES, BOX_FACES)
+    dup = box.copy()
+    dup.transform(RotX(90), [1, 2, 3])
+    dup.bake()
+    assert np.array_equal(box.vertices, BOX_VERTICES), "copy().bake() cambió el original"
+    rotated = box.transform(RotX(30)).copy()
+    box.bake()
+    assert np.array_equal(box.vertices, rotated), "bake() no tomó la posición transformada"
+    assert np.array_equal(src, BOX_VERTICES), "bake() cambió el arreglo del usuario"
+
+    expected = BOX_VERTICES @ RotX(90).T + [1, 2, 3]
+    assert np.allclose(dup.vertices, expected)
+
+    batch_src = np.stack([BOX_VERTICES, 2*BOX_VERTICES])
+    batch = MeshBatch(batch_src, BOX_EDGES)
+    batch.vertices += 1
+    assert np.array_equal(batch_src[0], BOX_VERTICES), "MeshBatch comparte vértices"
+    print("malla.py: ok")
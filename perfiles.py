@@ -0,0 +1,86 @@
+import numpy as np
+
+# ------------------ Perfiles de tiempo ------------------
+# Escalamiento temporal de reposo a reposo entre puntos articulares:
+# cúbico, quíntico y trapezoidal de velocidad. Todo se calcula como un solo
+# arreglo para muchas articulaciones y muchos segmentos a la vez, con
+# velocidad y aceleración junto a la posición.
+#
+#   t, q, qd, qdd = joint_profile(waypoints, durations, samples=50)
+
+
+def time_scaling(kind, tau, T, accel_frac=1/3):
+    # s(tau) normalizado en [0, 1] y sus derivadas respecto al tiempo
+    # ----------------------------------------------------------------------
+    # Arguments
+    # kind       -> 'cubic', 'quintic' o 'trapezoidal'
+    # tau        -> t/T en [0, 1], arreglo
+    # T          -> duración del segmento (se difunde contra tau)
+    # accel_frac -> fracción de T que dura la aceleración en el trapezoide
+    #               (0 < accel_frac <= 0.5)
+    # Returns
+    # s, sd, sdd con la forma de tau difundida contra T
+    # ----------------------------------------------------------------------
+    tau = np.clip(np.asarray(tau, dtype=float), 0, 1)
+    T = np.asarray(T, dtype=float)
+
+    if kind == 'cubic':
+        s = 3*tau**2 - 2*tau**3
+        ds = 6*tau - 6*tau**2
+        dds = 6 - 12*tau
+    elif kind == 'quintic':
+        s = 10*tau**3 - 15*tau**4 + 6*tau**5
+        ds = 30*tau**2 - 60*tau**3 + 30*tau**4
+        dds = 60*tau - 180*tau**2 + 120*tau**3
+    elif kind == 'trapezoidal':
+        ta = accel_frac
+        if not 0 < ta <= 0.5:
+            raise ValueError("accel_frac debe estar en (0, 0.5]")
+        v = 1 / (1 - ta)              # velocidad de crucero normalizada
+        a = v / ta                    # aceleración normalizada
+        acc, dec = tau < ta, tau > 1 - ta
+        s = np.where(acc, 0.5*a*tau**2,
+            np.where(dec, 1 - 0.5*a*(1 - tau)**2, 0.5*a*ta**2 + v*(tau - ta)))
+        ds = np.where(acc, a*tau, np.where(dec, a*(1 - tau), v))
+        dds = np.where(acc, a, np.where(dec, -a, 0.0))
+    else:
+        raise ValueError(f"perfil desconocido: {kind}")
+
+    return s + 0*T, ds / T, dds / T**2
+
+
+def joint_profile(waypoints, durations, samples=50, kind='quintic', accel_frac=1/3):
+    # Trayectoria articular por segmentos de reposo a reposo
+    # ----------------------------------------------------------------------
+    # Arguments
+    # waypoints -> (..., S+1, J) configuraciones por las que pasa el robot
+    # durations -> (..., S) duración de cada segmento (o escalar)
+    # samples   -> muestras por segmento
+    # Returns
+    # t   -> (..., S*samples+1) tiempos
+    # q   -> (..., S*samples+1, J) posición
+    # qd  -> (..., S*samples+1, J) velocidad
+    # qdd -> (..., S*samples+1, J) aceleración
+    # ----------------------------------------------------------------------
+    waypoints = np.asarray(waypoints, dtype=float)
+    q0, dq = waypoints[..., :-1, :], np.diff(waypoints, axis=-2)   # (..., S, J)
+    S = dq.shape[-2]
+    T = np.broadcast_to(np.asarray(durations, dtype=float), dq.shape[:-1])
+
+    tau = np.arange(samples) / samples                             # (n,)
+    s, sd, sdd = time_scaling(kind, tau, T[..., None], accel_frac)  # (..., S, n)
+
+    q = q0[..., None, :] + dq[..., None, :]*s[..., None]
+    qd = dq[..., None, :]*sd[..., None]
+    qdd = dq[..., None, :]*sdd[..., None]
+    t = np.cumsum(T, axis=-1)[..., None] - T[..., None] + tau*T[..., None]
+
+    # une los segmentos y agrega el último punto (en reposo)
+    lead = dq.shape[:-2]
+    J = dq.shape[-1]
+    q = np.concatenate([q.reshape(lead + (S*samples, J)), waypoints[..., -1:, :]], axis=-2)
+    qd = np.concatenate([qd.reshape(lead + (S*samples, J)), np.zeros(lead + (1, J))], axis=-2)
+    qdd_end = dq[..., -1:, :]*time_scaling(kind, 1.0, T[..., -1:], accel_frac)[2][..., None]
+    qdd = np.concatenate([qdd.reshape(lead + (S*samples, J)), qdd_end], axis=-2)
+    t = np.concatenate([t.reshape(lead + (S*samples,)), T.sum(axis=-1)[..., None]], axis=-1)
+    return t, q, qd, qdd
@@ -0,0 +1,230 @@
+import math
+import numpy as np
+
+# ------------------ Rotaciones en grados ------------------
+# Funciones compartidas por los scripts Box3D_*.py. Las versiones *_batch
+# reciben un arreglo 1-D de N ángulos y regresan una pila (N,3,3) en una
+# sola pasada vectorizada, útil para barridos fuera de línea.
+
+
+# ------------------ Tabla de senos/cosenos ------------------
+# Tabla opcional para ángulos múltiplos de una resolución (1° por defecto,
+# o fracciones como 0.1°). Se activa con enable_trig_table(); mientras está
+# activa, sind/cosd (y por lo tanto RotX/RotY/RotZ y sus versiones *_batch)
+# leen de la tabla cuando el ángulo cae sobre la malla y usan sin/cos para
+# cualquier otro valor. Los múltiplos de 90° son exactos, de modo que
+# cosd(90) regresa 0.0 en lugar de 6e-17.
+
+_TABLE = None
+
+
+def enable_trig_table(resolution=1.0):
+    # Precalcula sin/cos para 0, resolution, 2*resolution, ... < 360
+    # ----------------------------------------------------------------------
+    # Arguments
+    # resolution -> paso de la tabla en grados; 360/resolution debe ser
+    #               entero (1, 0.5, 0.1, ...)
+    # ----------------------------------------------------------------------
+    global _TABLE
+    if resolution <= 0:
+        raise ValueError("la resolución debe ser positiva")
+    n = 360/resolution
+    if abs(n - round(n)) > 1e-9:
+        raise ValueError("360 debe ser múltiplo de la resolución")
+    n = int(round(n))
+    r = np.arange(n)*(2*np.pi/n)
+    sin_t, cos_t = np.sin(r), np.cos(r)
+    # valores exactos en 0°, 90°, 180° y 270°
+    if n % 4 == 0:
+        q = np.arange(4)*(n//4)
+        sin_t[q] = [0, 1, 0, -1]
+        cos_t[q] = [1, 0, -1, 0]
+    _TABLE = (n/360, n, sin_t, cos_t, sin_t.tolist(), cos_t.tolist())
+
+
+def disable_trig_table():
+    global _TABLE
+    _TABLE = None
+
+
+def _table_index(t):
+    # Índice en la tabla para un ángulo escalar, o None si no cae en la malla
+    k = t*_TABLE[0]
+    ki = round(k)
+    if abs(k - ki) > 1e-9:
+        return None
+    return ki % _TABLE[1]
+
+
+def _table_lookup(t, col, func):
+    # Ruta vectorizada: lee de la tabla los ángulos que caen en la malla y
+    # calcula el resto con la función trascendental
+    t = np.asarray(t, dtype=float)
+    k = t*_TABLE[0]
+    ki = np.rint(k)
+    hit = np.abs(k - ki) <= 1e-9
+    out = np.empty_like(t)
+    out[hit] = _TABLE[col][ki[hit].astype(np.int64) % _TABLE[1]]
+    out[~hit] = func(t[~hit]*(np.pi/180))
+    return out if out.ndim else out[()]
+
+
+def sind(t):
+    # sind function
+    # Computes the sin() trigonometric function in degrees
+    # ----------------------------------------------------------------------
+    # Arguments
+    # t -> Numeric or array, angle in degrees.
+    # ----------------------------------------------------------------------
+    if _TABLE is not None:
+        if isinstance(t, (int, float)):
+            i = _table_index(t)
+            if i is not None:
+                return _TABLE[4][i]
+        else:
+            return _table_lookup(t, 2, np.sin)
+    return np.sin(np.multiply(t, np.pi/180))
+
+
+def cosd(t):
+    # cosd function
+    # Computes the cos() trigonometric function in degrees
+    # ----------------------------------------------------------------------
+    # Arguments
+    # t -> Numeric or array, angle in degrees.
+    # ----------------------------------------------------------------------
+    if _TABLE is not None:
+        if isinstance(t, (int, float)):
+            i = _table_index(t)
+            if i is not None:
+                return _TABLE[5][i]
+        else:
+            return _table_lookup(t, 3, np.cos)
+    return np.cos(np.multiply(t, np.pi/180))
+
+
+def sincosd(t):
+    # Regresa (sin, cos) de un ángulo escalar en grados como flotantes de
+    # Python; consulta la tabla si está activa
+    if _TABLE is not None:
+        i = _table_index(t)
+        if i is not None:
+            return _TABLE[4][i], _TABLE[5][i]
+    r = math.radians(t)
+    return math.sin(r), math.cos(r)
+
+
+def RotX(t):
+    c, s = cosd(t), sind(t)
+    return np.array([[1,0,0],[0,c,-s],[0,s,c]])
+
+
+def RotY(t):
+    c, s = cosd(t), sind(t)
+    return np.array([[c,0,s],[0,1,0],[-s,0,c]])
+
+
+def RotZ(t):
+    c, s = cosd(t), sind(t)
+    return np.array([[c,-s,0],[s,c,0],[0,0,1]])
+
+
+def _rot_batch(t, i, j):
+    # Construye una pila (N,3,3) de rotaciones sobre el eje normal al plano
+    # (i, j). Solo se llenan las cuatro entradas que dependen del ángulo.
+    # ----------------------------------------------------------------------
+    # Arguments
+    # t    -> array-like 1-D, N ángulos en grados
+    # i, j -> índices de las filas/columnas que rota el eje
+    # ----------------------------------------------------------------------
+    t = np.asarray(t, dtype=float).reshape(-1)
+    c, s = cosd(t), sind(t)
+    R = np.zeros((t.size, 3, 3))
+    k = 3 - i - j
+    R[:, k, k] = 1
+    R[:, i, i] = c
+    R[:, j, j] = c
+    R[:, i, j] = -s
+    R[:, j, i] = s
+    return R
+
+
+def RotX_batch(t):
+    # Versión vectorizada de RotX: t (N,) -> (N,3,3)
+    return _rot_batch(t, 1, 2)
+
+
+def RotY_batch(t):
+    # Versión vectorizada de RotY: t (N,) -> (N,3,3)
+    return _rot_batch(t, 2, 0)
+
+
+def RotZ_batch(t):
+    # Versión vectorizada de RotZ: t (N,) -> (N,3,3)
+    return _rot_batch(t, 0, 1)
+
+
+def rotate_points_batch(R, points):
+    # Aplica una pila de rotaciones (N,3,3) a un arreglo de puntos (P,3)
+    # y regresa (N,P,3): todos los cuadros de la animación en una llamada.
+    points = np.asarray(points, dtype=float)
+    return np.einsum('nij,pj->npi', R, points)
+
+
+# ------------------ Rotación incremental ------------------
+
+class IncrementalRotation:
+    # Giro a velocidad constante aplicado cuadro a cuadro: en cada step() se
+    # multiplica el arreglo de vértices por la misma rotación delta, en su
+    # lugar, en vez de reconstruir la rotación desde el ángulo absoluto.
+    # ----------------------------------------------------------------------
+    # Arguments
+    # points      -> (P,3) vértices en la orientación inicial
+    # delta       -> (3,3) rotación que se aplica por cuadro, p. ej. RotX(1)
+    # tol         -> error máximo permitido en |R^T R - I| de la rotación
+    #                acumulada antes de corregir
+    # check_every -> cada cuántos pasos se mide el error
+    # ----------------------------------------------------------------------
+    # La rotación acumulada R también se lleva con un producto 3x3 por
+    # cuadro. Al medir, si R se alejó de ser ortonormal más que tol, se
+    # re-ortonormaliza (SVD) y los vértices se recalculan desde los
+    # originales, de modo que el error no crece sin límite en corridas largas.
+    def __init__(self, points, delta, tol=1e-12, check_every=64):
+        self.reference = np.array(points, dtype=float).reshape(-1, 3)
+        self.points = self.reference.copy()
+        self.delta = np.array(delta, dtype=float)
+        self.tol = tol
+        self.check_every = check_every
+        self.R = np.eye(3)
+        self.steps = 0
+        self.corrections = 0
+        self._deltaT = np.ascontiguousarray(self.delta.T)
+        self._tmp = np.empty_like(self.points)
+        self._R_tmp = np.empty((3, 3))
+
+    def step(self):
+        # Avanza un cuadro; regresa self.points (el mismo arreglo siempre)
+        np.matmul(self.points, self._deltaT, out=self._tmp)
+        self.points[...] = self._tmp
+        np.matmul(self.delta, self.R, out=self._R_tmp)
+        self.R, self._R_tmp = self._R_tmp, self.R
+        self.steps += 1
+        if self.steps % self.check_every == 0 and self.error() > self.tol:
+            self.renormalize()
+        return self.points
+
+    def error(self):
+        # Desviación de R respecto a una rotación: max |R^T R - I|
+        return float(np.abs(self.R.T @ self.R - np.eye(3)).max())
+
+    def renormalize(self):
+        # Proyecta R a la rotación más cercana y resincroniza los vértices
+        U, _, Vt = np.linalg.svd(self.R)
+        self.R[...] = U @ Vt
+        np.matmul(self.reference, self.R.T, out=self.points)
+        self.corrections += 1
+
+    def reset(self):
+        self.R[...] = np.eye(3)
+        self.points[...] = self.reference
+        self.steps = 0
@@ -0,0 +1,237 @@
+import numpy as np
+from rotaciones import sind, cosd, sincosd, RotX_batch, RotY_batch, RotZ_batch
+
+# ------------------ Transformaciones homogéneas ------------------
+# Familia TRx/TRy/TRz (rotaciones) y TTx/TTy/TTz (traslaciones) usada en
+# EXAMEN.py. Las versiones *_batch construyen pilas (N,4,4) para N cuadros
+# y compose_chain compone una cadena completa para todos los cuadros con
+# matmul por lotes.
+
+
+def TRx(t):
+    return np.array([[1, 0, 0, 0],
+                     [0, cosd(t), -sind(t), 0],
+                     [0, sind(t), cosd(t), 0],
+                     [0, 0, 0, 1]])
+
+
+def TRy(t):
+    return np.array([[cosd(t), 0, sind(t), 0],
+                     [0, 1, 0, 0],
+                     [-sind(t), 0, cosd(t), 0],
+                     [0, 0, 0, 1]])
+
+
+def TRz(t):
+    return np.array([[cosd(t), -sind(t), 0, 0],
+                     [sind(t), cosd(t), 0, 0],
+                     [0, 0, 1, 0],
+                     [0, 0, 0, 1]])
+
+
+def TTx(t):
+    return np.array([[1, 0, 0, t],
+                     [0, 1, 0, 0],
+                     [0, 0, 1, 0],
+                     [0, 0, 0, 1]])
+
+
+def TTy(t):
+    return np.array([[1, 0, 0, 0],
+                     [0, 1, 0, t],
+                     [0, 0, 1, 0],
+                     [0, 0, 0, 1]])
+
+
+def TTz(t):
+    return np.array([[1, 0, 0, 0],
+                     [0, 1, 0, 0],
+                     [0, 0, 1, t],
+                     [0, 0, 0, 1]])
+
+
+# ------------------ Pilas (N,4,4) ------------------
+
+def _homogeneous_batch(R):
+    # Empaqueta una pila de rotaciones (N,3,3) en transformaciones (N,4,4)
+    T = np.zeros((R.shape[0], 4, 4))
+    T[:, :3, :3] = R
+    T[:, 3, 3] = 1
+    return T
+
+
+def _translation_batch(d, axis):
+    d = np.asarray(d, dtype=float).reshape(-1)
+    T = np.zeros((d.size, 4, 4))
+    T[:, [0, 1, 2, 3], [0, 1, 2, 3]] = 1
+    T[:, axis, 3] = d
+    return T
+
+
+def TRx_batch(t):
+    # Versión vectorizada de TRx: t (N,) grados -> (N,4,4)
+    return _homogeneous_batch(RotX_batch(t))
+
+
+def TRy_batch(t):
+    # Versión vectorizada de TRy: t (N,) grados -> (N,4,4)
+    return _homogeneous_batch(RotY_batch(t))
+
+
+def TRz_batch(t):
+    # Versión vectorizada de TRz: t (N,) grados -> (N,4,4)
+    return _homogeneous_batch(RotZ_batch(t))
+
+
+def TTx_batch(t):
+    # Versión vectorizada de TTx: t (N,) -> (N,4,4)
+    return _translation_batch(t, 0)
+
+
+def TTy_batch(t):
+    # Versión vectorizada de TTy: t (N,) -> (N,4,4)
+    return _translation_batch(t, 1)
+
+
+def TTz_batch(t):
+    # Versión vectorizada de TTz: t (N,) -> (N,4,4)
+    return _translation_batch(t, 2)
+
+
+# ------------------ Cadenas seriales ------------------
+
+def compose_chain(stages):
+    # Compone una cadena serial T1, T1·T2, T1·T2·T3, ... para N cuadros
+    # ----------------------------------------------------------------------
+    # Arguments
+    # stages -> lista de etapas; cada una es una pila (N,4,4) o una matriz
+    #           (4,4) constante que se repite en todos los cuadros
+    # Returns
+    # arreglo (N, len(stages), 4, 4) con todas las transformaciones
+    # acumuladas, en el mismo orden que T1, T12, T123, ... de EXAMEN.py
+    # ----------------------------------------------------------------------
+    stages = [np.asarray(A, dtype=float) for A in stages]
+    N = max([A.shape[0] for A in stages if A.ndim == 3] or [1])
+    out = np.empty((N, len(stages), 4, 4))
+    out[:, 0] = stages[0]
+    for k in range(1, len(stages)):
+        np.matmul(out[:, k-1], stages[k], out=out[:, k])
+    return out
+
+
+def chain_origins(stages):
+    # Orígenes de todos los marcos intermedios de la cadena: (N, links, 3)
+    return compose_chain(stages)[:, :, :3, 3]
+
+
+# ------------------ Transformación rígida ------------------
+
+class RigidTransform:
+    # Transformación rígida con rotación R (3,3) y traslación p (3,)
+    # guardadas por separado como flotantes de Python (R por filas). Las
+    # composiciones con rotaciones y traslaciones sobre un eje se hacen en
+    # sitio y solo tocan las entradas que cambian, en lugar de construir una
+    # matriz 4x4 nueva y hacer un producto denso:
+    #
+    #   T.dot(TRz(n))  ->  T.rotate_z(n)    (actualiza 2 columnas de R)
+    #   T.dot(TTx(l))  ->  T.translate_x(l) (actualiza solo p)
+    #
+    # Para una sola transformación esto evita por completo el costo de crear
+    # arreglos de NumPy. Los métodos regresan self para encadenar llamadas.
+
+    def __init__(self, R=None, p=None):
+        if R is None:
+            self._R = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+        else:
+            self._R = np.asarray(R, dtype=float).reshape(9).tolist()
+        if p is None:
+            self._p = [0.0, 0.0, 0.0]
+        else:
+            self._p = np.asarray(p, dtype=float).reshape(3).tolist()
+
+    @classmethod
+    def from_matrix(cls, T):
+        T = np.asarray(T, dtype=float)
+        return cls(T[:3, :3], T[:3, 3])
+
+    @property
+    def R(self):
+        return np.array(self._R).reshape(3, 3)
+
+    @property
+    def p(self):
+        return np.array(self._p)
+
+    @property
+    def origin(self):
+        return self.p
+
+    def matrix(self):
+        T = np.eye(4)
+        T[:3, :3] = self.R
+        T[:3, 3] = self._p
+        return T
+
+    def copy(self):
+        T = RigidTransform.__new__(RigidTransform)
+        T._R = self._R[:]
+        T._p = self._p[:]
+        return T
+
+    def _rotate_columns(self, i, j, t):
+        # R <- R·Rot(t) para la rotación que mezcla las columnas i y j
+        s, c = sincosd(t)
+        R = self._R
+        for k in (0, 3, 6):
+            a, b = R[k+i], R[k+j]
+            R[k+i] = c*a + s*b
+            R[k+j] = c*b - s*a
+        return self
+
+    def rotate_x(self, t):
+        return self._rotate_columns(1, 2, t)
+
+    def rotate_y(self, t):
+        return self._rotate_columns(2, 0, t)
+
+    def rotate_z(self, t):
+        return self._rotate_columns(0, 1, t)
+
+    def _translate(self, axis, d):
+        # p <- p + d·R[:,axis]
+        R, p = self._R, self._p
+        p[0] += d*R[axis]
+        p[1] += d*R[3+axis]
+        p[2] += d*R[6+axis]
+        return self
+
+    def translate_x(self, d):
+        return self._translate(0, d)
+
+    def translate_y(self, d):
+        return self._translate(1, d)
+
+    def translate_z(self, d):
+        return self._translate(2, d)
+
+    def compose(self, other):
+        # Regresa self·other como una nueva transformación
+        A, B, q = self._R, other._R, other._p
+        T = RigidTransform.__new__(RigidTransform)
+        T._R = [A[r]*B[c] + A[r+1]*B[3+c] + A[r+2]*B[6+c]
+                for r in (0, 3, 6) for c in (0, 1, 2)]
+        T._p = [A[r]*q[0] + A[r+1]*q[1] + A[r+2]*q[2] + self._p[r//3]
+                for r in (0, 3, 6)]
+        return T
+
+    def inverse(self):
+        # Inversa cerrada: (R, p)^-1 = (R^T, -R^T p)
+        R, p = self._R, self._p
+        T = RigidTransform.__new__(RigidTransform)
+        T._R = [R[0], R[3], R[6], R[1], R[4], R[7], R[2], R[5], R[8]]
+        T._p = [-(R[c]*p[0] + R[3+c]*p[1] + R[6+c]*p[2]) for c in (0, 1, 2)]
+        return T
+
+    def apply(self, points):
+        # Aplica R·p + t a un arreglo de puntos (P,3)
+        return np.asarray(points, dtype=float) @ self.R.T + self.p